@@ -4,6 +4,8 @@ from open_pico_local_api.exceptions.pico_device_error import PicoDeviceError
 class NotSupportedError(PicoDeviceError):
     """Raised when an operation is not supported by the device"""
 
+    __slots__ = ('reason',)
+
     def __init__(self, reason):
         self.reason = reason
         super().__init__(reason)
\ No newline at end of file
@@ -1,3 +1,3 @@
 class PicoDeviceError(Exception):
     """Base exception for Pico device errors"""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -3,4 +3,4 @@ from open_pico_local_api.exceptions.pico_device_error import PicoDeviceError
 
 class PicoTimeoutError(PicoDeviceError):
     """Raised when operation times out"""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
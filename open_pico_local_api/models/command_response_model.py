@@ -1,9 +1,7 @@
-from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, NamedTuple
 
 
-@dataclass
-class CommandResponseModel:
+class CommandResponseModel(NamedTuple):
     """Models that we receive in response to commands sent to the device"""
     idp: int
     frame_from: str
@@ -1,8 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfoModel:
     """Device identification and hardware info"""
     ip: str
@@ -19,10 +19,16 @@ class DeviceInfoModel:
     slave_bitmap: int  # bmp_slave
     maintenance: List[int] # man
 
+    # Built once in __post_init__ (the firmware fields are not mutated after parsing)
+    _firmware_full: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._firmware_full = f"{self.firmware_version} ({self.firmware_note})"
+
     @property
     def firmware_full(self) -> str:
         """Full firmware version string"""
-        return f"{self.firmware_version} ({self.firmware_note})"
+        return self._firmware_full
 
     @property
     def has_datamatrix(self) -> bool:
@@ -4,7 +4,7 @@ from open_pico_local_api.enums.device_mode_enum import DeviceModeEnum
 from open_pico_local_api.enums.on_off_state_enum import OnOffStateEnum
 
 
-@dataclass
+@dataclass(slots=True)
 class OperatingParametersModel:
     """Device operating parameters"""
     mode: DeviceModeEnum  # mod
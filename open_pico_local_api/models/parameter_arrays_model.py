@@ -1,8 +1,8 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterArraysModel:
     """Device parameter arrays"""
     realtime: List[int]  # par_rt
@@ -12,15 +12,22 @@ class ParameterArraysModel:
     errors: List[List[int]]  # err
     manual: List[int]  # man
 
+    # Flattened error codes, built in one pass on first access (errors is not mutated after parsing)
+    _active_errors: Optional[List[int]] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def has_errors(self) -> bool:
         """Check if device has any errors."""
-        return any(len(err_list) > 0 for err_list in self.errors)
+        return bool(self.active_errors)
 
     @property
     def active_errors(self) -> List[int]:
-        """Get all active error codes."""
-        errors = []
-        for err_list in self.errors:
-            errors.extend(err_list)
-        return errors
\ No newline at end of file
+        """Get all active error codes (cached; do not mutate the returned list)."""
+        if self._active_errors is None:
+            self._active_errors = [code for err_list in self.errors for code in err_list]
+        return self._active_errors
+
+    @property
+    def error_count(self) -> int:
+        """Number of active error codes."""
+        return len(self.active_errors)
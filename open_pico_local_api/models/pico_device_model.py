@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 import logging
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 from open_pico_local_api.enums.device_mode_enum import DeviceModeEnum
 from open_pico_local_api.enums.on_off_state_enum import OnOffStateEnum
@@ -14,8 +15,160 @@ from open_pico_local_api.utils.constants import MODULAR_FAN_SPEED_PRESET_MODES,
 
 _LOGGER = logging.getLogger(__name__)
 
+# (attribute, payload key, default) triples for the plain sub-model fields.
+# Fields that need conversion (floats, enums) are spelled out in _compile_from_dict().
+# A default of ``list`` means "a fresh empty list" so instances never share one.
+_DEVICE_INFO_FIELDS = (
+    ("ip", "ip", ""),
+    ("firmware_version", "fw_ver", ""),
+    ("firmware_note", "fw_note", ""),
+    ("version", "vr", 0),
+    ("model", "modello", 0),
+    ("base_top", "BaseTop", 0),
+    ("grid_datamatrix", "Grd_DM", ""),
+    ("config_mode", "config_mod", 0),
+    ("slave_id", "id_slave", 0),
+    ("name", "name", ""),
+    ("has_slave", "has_slave", 0),
+    ("slave_bitmap", "bmp_slave", 0),
+    ("maintenance", "man", list),
+)
 
-@dataclass
+_SENSOR_FIELDS = (
+    ("air_quality", "v_AirQ", 0),
+    ("tvoc", "v_Tvoc", 0),
+    ("eco2", "v_ECo2", 0),
+    ("humidity_raw", "umd_raw", 0),
+    ("co2_setpoint", "s_co2", 0),
+)
+
+_PARAMETER_FIELDS = (
+    ("realtime", "par_rt", list),
+    ("minmax", "par_mm", list),
+    ("ambient", "par_amb", list),
+    ("external", "par_ext", list),
+    ("errors", "err", list),
+    ("manual", "man", list),
+)
+
+_OPERATING_FIELDS = (
+    ("step_mode", "step_mod", 0),
+    ("speed", "speed", 0),
+    ("speed_requested", "spd_rich", 0),
+    ("speed_row", "spd_row", 0),
+    ("fan_direction", "fan_dir", 0),
+    ("direction", "verso", 0),
+    ("delta_temp_cycle", "Delta_tmprCiclo", 0),
+    ("delta_humidity_cycle", "Delta_umdCiclo", 0),
+    ("night_mode", "night_mod", 0),
+    ("led_on_off", "led_on_off", 0),
+    ("led_on_off_short", "led_on_off_breve", 0),
+    ("led_color", "led_color", 0),
+    ("chrono_mode", "m_crono", 0),
+    ("timer_active", "tw_active", 0),
+)
+
+_SYSTEM_FIELDS = (
+    ("counter", "cntr", 0),
+    ("memory_free", "memfree", 0),
+    ("uptime", "up_time", 0),
+    ("date", "date", ""),
+    ("time", "time", ""),
+    ("week", "week", -1),
+)
+
+# Raw value -> enum member, so parsing skips the EnumMeta.__call__ dispatch
+_MODE_MAP = {m.value: m for m in DeviceModeEnum}
+_ON_OFF_MAP = {m.value: m for m in OnOffStateEnum}
+_HUMIDITY_MAP = {m.value: m for m in TargetHumidityEnum}
+
+
+def mode_from_value(value: Any) -> Optional[DeviceModeEnum]:
+    """Return the DeviceModeEnum member for a raw ``mod`` value, or None if it is not a known mode."""
+    return _MODE_MAP.get(value) if isinstance(value, int) else None
+
+
+def _parse_mode(value: Any) -> DeviceModeEnum:
+    try:
+        return _MODE_MAP[value]
+    except (KeyError, TypeError):
+        _LOGGER.warning("Unknown device mode value: %s — defaulting to HEAT_RECOVERY", value)
+        return DeviceModeEnum.HEAT_RECOVERY
+
+
+def _parse_on_off(value: Any) -> OnOffStateEnum:
+    try:
+        return _ON_OFF_MAP[value]
+    except (KeyError, TypeError):
+        _LOGGER.warning("Unknown on_off value: %s — defaulting to OFF", value)
+        return OnOffStateEnum.OFF
+
+
+def _parse_humidity(value: Any) -> TargetHumidityEnum:
+    try:
+        return _HUMIDITY_MAP[value]
+    except (KeyError, TypeError):
+        _LOGGER.warning("Unknown humidity setpoint value: %s — defaulting to FIFTY_PERCENT", value)
+        return TargetHumidityEnum.FIFTY_PERCENT
+
+
+def _kwargs_source(fields) -> str:
+    """Render a field table as literal ``attr=get(key, default)`` arguments."""
+    parts = []
+    for attr, key, default in fields:
+        if default is list:
+            parts.append(f"{attr}=(data[{key!r}] if {key!r} in data else [])")
+        else:
+            parts.append(f"{attr}=get({key!r}, {default!r})")
+    return ", ".join(parts)
+
+
+def _compile_from_dict():
+    """
+    Generate the body of PicoDeviceModel.from_dict from the field tables.
+
+    The result is a single expression with every key and default inlined and
+    the model classes and enum parsers bound as default arguments (fast
+    locals), so parsing a status frame runs no per-field loop or dict merge.
+    """
+    src = (
+        "def _from_dict(cls, data, *, DI=DeviceInfoModel, SR=SensorReadingsModel,"
+        " PA=ParameterArraysModel, OP=OperatingParametersModel, SY=SystemInfoModel,"
+        " mode=_parse_mode, on_off=_parse_on_off, humidity=_parse_humidity):\n"
+        "    get = data.get\n"
+        "    return cls(\n"
+        "        idp=get('idp', 0), frame_from=get('frm', ''),"
+        " command=get('cmd', ''), response=get('res', 0),\n"
+        f"        device_info=DI({_kwargs_source(_DEVICE_INFO_FIELDS)}),\n"
+        "        sensors=SR(temperature=float(get('v_tmpr', 0.0)),"
+        " humidity=float(get('v_umd', 0.0)),"
+        " humidity_setpoint=humidity(get('s_umd', 0)),"
+        f" {_kwargs_source(_SENSOR_FIELDS)}),\n"
+        f"        parameters=PA({_kwargs_source(_PARAMETER_FIELDS)}),\n"
+        "        operating=OP(mode=mode(get('mod', 1)), on_off=on_off(get('on_off', 0)),"
+        f" {_kwargs_source(_OPERATING_FIELDS)}),\n"
+        f"        system=SY({_kwargs_source(_SYSTEM_FIELDS)}),\n"
+        "        raw_data=data,\n"
+        "    )\n"
+    )
+    namespace = {
+        "DeviceInfoModel": DeviceInfoModel,
+        "SensorReadingsModel": SensorReadingsModel,
+        "ParameterArraysModel": ParameterArraysModel,
+        "OperatingParametersModel": OperatingParametersModel,
+        "SystemInfoModel": SystemInfoModel,
+        "_parse_mode": _parse_mode,
+        "_parse_on_off": _parse_on_off,
+        "_parse_humidity": _parse_humidity,
+    }
+    exec(compile(src, f"<{__name__}.from_dict>", "exec"), namespace)
+    return namespace["_from_dict"]
+
+
+_from_dict = _compile_from_dict()
+
+
+@dataclass(slots=True)
 class PicoDeviceModel:
     """
     Complete Pico device status
@@ -55,105 +208,26 @@ class PicoDeviceModel:
             >>> status = PicoDeviceModel.from_dict(data)
             >>> print(status.sensors.temperature_celsius)
         """
-        device_info = DeviceInfoModel(
-            ip=data.get("ip", ""),
-            firmware_version=data.get("fw_ver", ""),
-            firmware_note=data.get("fw_note", ""),
-            version=data.get("vr", 0),
-            model=data.get("modello", 0),
-            base_top=data.get("BaseTop", 0),
-            grid_datamatrix=data.get("Grd_DM", ""),
-            config_mode=data.get("config_mod", 0),
-            slave_id=data.get("id_slave", 0),
-            name=data.get("name", ""),
-            has_slave=data.get("has_slave", 0),
-            slave_bitmap=data.get("bmp_slave", 0),
-            maintenance=data.get("man", [])
-        )
+        return _from_dict(cls, data)
 
-        try:
-            mode = DeviceModeEnum(data.get("mod", 1))
-        except ValueError:
-            _LOGGER.warning(f"Unknown device mode value: {data.get('mod')} — defaulting to HEAT_RECOVERY")
-            mode = DeviceModeEnum.HEAT_RECOVERY
-
-        try:
-            on_off = OnOffStateEnum(data.get("on_off", 0))
-        except ValueError:
-            _LOGGER.warning(f"Unknown on_off value: {data.get('on_off')} — defaulting to OFF")
-            on_off = OnOffStateEnum.OFF
-
-        try:
-            humidity_setpoint = TargetHumidityEnum(data.get("s_umd", 0))
-        except ValueError:
-            _LOGGER.warning(f"Unknown humidity setpoint value: {data.get('s_umd')} — defaulting to FIFTY_PERCENT")
-            humidity_setpoint = TargetHumidityEnum.FIFTY_PERCENT
-
-        sensors = SensorReadingsModel(
-            temperature=float(data.get("v_tmpr", 0.0)),
-            humidity=float(data.get("v_umd", 0.0)),
-            air_quality=data.get("v_AirQ", 0),
-            tvoc=data.get("v_Tvoc", 0),
-            eco2=data.get("v_ECo2", 0),
-            humidity_raw=data.get("umd_raw", 0),
-            humidity_setpoint=humidity_setpoint,
-            co2_setpoint=data.get("s_co2", 0)
-        )
-
-        parameters = ParameterArraysModel(
-            realtime=data.get("par_rt", []),
-            minmax=data.get("par_mm", []),
-            ambient=data.get("par_amb", []),
-            external=data.get("par_ext", []),
-            errors=data.get("err", []),
-            manual=data.get("man", [])
-        )
-
-        operating = OperatingParametersModel(
-            mode=mode,
-            step_mode=data.get("step_mod", 0),
-            on_off=on_off,
-            speed=data.get("speed", 0),
-            speed_requested=data.get("spd_rich", 0),
-            speed_row=data.get("spd_row", 0),
-            fan_direction=data.get("fan_dir", 0),
-            direction=data.get("verso", 0),
-            delta_temp_cycle=data.get("Delta_tmprCiclo", 0),
-            delta_humidity_cycle=data.get("Delta_umdCiclo", 0),
-            night_mode=data.get("night_mod", 0),
-            led_on_off=data.get("led_on_off", 0),
-            led_on_off_short=data.get("led_on_off_breve", 0),
-            led_color=data.get("led_color", 0),
-            chrono_mode=data.get("m_crono", 0),
-            timer_active=data.get("tw_active", 0)
-        )
-
-        system = SystemInfoModel(
-            counter=data.get("cntr", 0),
-            memory_free=data.get("memfree", 0),
-            uptime=data.get("up_time", 0),
-            date=data.get("date", ""),
-            time=data.get("time", ""),
-            week=data.get("week", -1)
-        )
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the raw device dictionary.
 
-        return cls(
-            idp=data.get("idp", 0),
-            frame_from=data.get("frm", ""),
-            command=data.get("cmd", ""),
-            response=data.get("res", 0),
-            device_info=device_info,
-            sensors=sensors,
-            parameters=parameters,
-            operating=operating,
-            system=system,
-            raw_data=data
-        )
+        The dictionary is returned by reference (no copy) and must not be
+        mutated; use copy_dict() when a modifiable copy is needed.
+        """
+        return self.raw_data
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert back to dictionary format."""
+    def copy_dict(self) -> Dict[str, Any]:
+        """Return a shallow copy of the raw device dictionary, safe to mutate."""
         return self.raw_data.copy()
 
+    @property
+    def raw(self) -> Mapping[str, Any]:
+        """Read-only view of the raw device dictionary."""
+        return MappingProxyType(self.raw_data)
+
     @property
     def is_healthy(self) -> bool:
         """Check if device is in healthy state."""
@@ -1,10 +1,9 @@
-from dataclasses import dataclass
+from typing import NamedTuple
 
 from open_pico_local_api.enums.target_humidity_enum import TargetHumidityEnum
 
 
-@dataclass
-class SensorReadingsModel:
+class SensorReadingsModel(NamedTuple):
     """Real-time sensor readings"""
     temperature: float  # v_tmpr
     humidity: float  # v_umd
@@ -1,8 +1,7 @@
-from dataclasses import dataclass
+from typing import NamedTuple
 
 
-@dataclass
-class SystemInfoModel:
+class SystemInfoModel(NamedTuple):
     """System information and diagnostics"""
     counter: int  # cntr
     memory_free: int  # memfree
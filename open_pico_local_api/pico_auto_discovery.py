@@ -8,12 +8,12 @@ devices are hardcoded by the manufacturer to respond only to that port.
 """
 
 import asyncio
-import json
 import logging
 from ipaddress import ip_network, IPv4Network
 from typing import Any, Dict, List, Set
 
 from open_pico_local_api.shared_transport_manager import SharedTransportManager
+from open_pico_local_api.utils.json_codec import json_dumps
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,12 +22,12 @@ _PROBE_CMD = "stato_sync"
 
 
 def _build_probe(pin: str) -> bytes:
-    return json.dumps({
+    return json_dumps({
         "cmd": _PROBE_CMD,
         "frm": "app",
         "pin": pin,
         "idp": _DISCOVERY_IDP,
-    }).encode("utf-8")
+    })
 
 
 def _is_valid_pico_response(response: Dict[str, Any]) -> bool:
@@ -126,16 +126,15 @@ class PicoAutoDiscovery:
             if remaining <= 0:
                 break
             try:
-                response, addr = await asyncio.wait_for(
-                    unmatched_queue.get(), timeout=min(remaining, 0.5)
-                )
-                if _is_valid_pico_response(response):
-                    ip = addr[0]
-                    discovered.add(ip)
-                    if verbose:
-                        _LOGGER.debug(f"✓ Discovered Pico at {ip} (fw: {response.get('fw_ver', '?')})")
+                # Sleep until the next packet or the deadline - no fixed polling slice
+                response, addr = await asyncio.wait_for(unmatched_queue.get(), timeout=remaining)
             except asyncio.TimeoutError:
-                continue
+                break
+            if _is_valid_pico_response(response):
+                ip = addr[0]
+                discovered.add(ip)
+                if verbose:
+                    _LOGGER.debug("✓ Discovered Pico at %s (fw: %s)", ip, response.get('fw_ver', '?'))
 
     @staticmethod
     async def _subnet_scan(
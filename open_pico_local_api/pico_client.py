@@ -4,9 +4,9 @@ Modified PicoClient that uses shared transport for multiple devices
 
 import logging
 import asyncio
-import json
 import random
-from typing import Optional, Dict, Any, Union, List
+import time
+from typing import Optional, Dict, Any, Union, List, Tuple
 
 from open_pico_local_api.enums.device_mode_enum import DeviceModeEnum
 from open_pico_local_api.enums.target_humidity_enum import TargetHumidityEnum
@@ -15,13 +15,30 @@ from open_pico_local_api.exceptions.pico_device_error import PicoDeviceError
 from open_pico_local_api.exceptions.pico_connection_error import PicoConnectionError
 from open_pico_local_api.exceptions.pico_timeout_error import PicoTimeoutError
 from open_pico_local_api.models.command_response_model import CommandResponseModel
-from open_pico_local_api.models.pico_device_model import PicoDeviceModel
+from open_pico_local_api.models.pico_device_model import PicoDeviceModel, mode_from_value
 from open_pico_local_api.shared_transport_manager import SharedTransportManager
 from open_pico_local_api.utils.constants import HUMIDITY_SELECTOR_PRESET_MODES, MODULAR_FAN_SPEED_PRESET_MODES
+from open_pico_local_api.utils.json_codec import json_dumps
 
 _LOGGER = logging.getLogger(__name__)
 __version__ = "2.5.2"
 
+# Pre-encoded command fields per enum member. IntEnum members hash like their
+# int values, so plain ints hit the same entries.
+_MODE_FIELDS = {m: b'"mod":%d,"on_off":1' % m for m in DeviceModeEnum}
+_HUMIDITY_FIELDS = {h: b'"s_umd":%d' % h for h in TargetHumidityEnum}
+
+# sync_idp_on_connect: IDPs probed from the range start, and how long to wait on each
+_PROBE_IDP_WINDOW = 5
+_PROBE_IDP_TIMEOUT = 0.3
+
+# Delay before IDP sync candidate n >= 2 of an attempt: _IDP_SYNC_BACKOFF * 2 ** (n - 2), capped
+_IDP_SYNC_BACKOFF = 0.05
+_IDP_SYNC_BACKOFF_MAX = 0.5
+
+# Capacity of the late / unsolicited packet queue, drained at the start of every command
+_RESPONSE_QUEUE_SIZE = 16
+
 class PicoClient:
     """
     Pico device client using shared UDP transport.
@@ -42,16 +59,30 @@ class PicoClient:
             retry_delay: float = 2.0,
             verbose: bool = False,
             poll_jitter: float = 0.0,
+            idp_sync_batch: int = 1,
+            mode_cache_ttl: float = 5.0,
+            transport_options: Optional[Dict[str, Any]] = None,
+            sync_idp_on_connect: bool = False,
     ):
         self.ip = ip
         self.pin = pin
         self.device_port = device_port
+        self._addr = (ip, device_port)  # Resolved once; the send path skips the registration lookup
         self.local_port = local_port
         self.timeout = timeout
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
         self.verbose = verbose
         self.poll_jitter = poll_jitter
+        # IDP sync candidates sent together per round; >1 trades extra packets for faster resync
+        self.idp_sync_batch = max(1, idp_sync_batch)
+        # How long the last seen operating mode may stand in for a get_status() mode check
+        self.mode_cache_ttl = mode_cache_ttl
+        # Extra SharedTransportManager.initialize() arguments (e.g. rcvbuf / sndbuf);
+        # only used by the client that creates the shared socket
+        self.transport_options = transport_options or {}
+        # Probe the device once on connect so the first real command starts on a matching IDP
+        self.sync_idp_on_connect = sync_idp_on_connect
 
         # Generate device_id if not provided
         self.device_id = device_id or f"{ip}:{device_port}"
@@ -64,12 +95,16 @@ class PicoClient:
         self._idp_range_start = 1
         self._idp_range_size = 10000
 
-        self._response_queue = asyncio.Queue()
-        self._lock = asyncio.Lock()
+        # Unsolicited / late packets only; bounded, the transport drops them once it is full
+        self._response_queue = asyncio.Queue(maxsize=_RESPONSE_QUEUE_SIZE)
+        self._pending: Dict[int, Tuple[asyncio.Future, asyncio.Future]] = {}  # idp -> (ack, response)
         self._command_lock = asyncio.Lock()  # Serializes _execute_command_with_retry calls
         self._connected = False
         self._event_callbacks = {}
 
+        self._last_mode: Optional[DeviceModeEnum] = None
+        self._last_mode_ts = 0.0
+
     async def __aenter__(self):
         """Async context manager entry"""
         await self.connect()
@@ -85,6 +120,26 @@ class PicoClient:
         """Check if device is connected"""
         return self._connected
 
+    @property
+    def pin(self) -> str:
+        """Device PIN sent with every command"""
+        return self._pin
+
+    @pin.setter
+    def pin(self, value: str) -> None:
+        self._pin = value
+        # Pre-encoded constant part of every command; only the fields and the idp vary per send
+        pin_json = json_dumps(value)
+        self._upd_tail = b'"cmd":"upd_pico","frm":"app","pin":' + pin_json
+        self._status_body = b'{"cmd":"stato_sync","frm":"app","pin":' + pin_json
+        # Two-state commands only ever send one of two bodies
+        self._turn_on_body = self._upd_body(b'"on_off":1')
+        self._turn_off_body = self._upd_body(b'"on_off":2')
+        self._night_on_body = self._upd_body(b'"night_mod":1')
+        self._night_off_body = self._upd_body(b'"night_mod":2')
+        self._led_on_body = self._upd_body(b'"led_on_off_breve":1')
+        self._led_off_body = self._upd_body(b'"led_on_off_breve":2')
+
     async def reset_idp(self) -> None:
         """
         Manually reset IDP counter to start of range.
@@ -92,9 +147,9 @@ class PicoClient:
         Useful when device communication is stuck due to IDP mismatch.
         This can happen if the device was restarted or lost power.
         """
-        await self._reset_idp_counter()
+        self._reset_idp_counter()
         if self.verbose:
-            _LOGGER.debug(f"✓ [{self.device_id}] IDP counter manually reset")
+            _LOGGER.debug("✓ [%s] IDP counter manually reset", self.device_id)
 
     async def connect(self) -> None:
         """Connect to the Pico device via the shared UDP transport."""
@@ -107,7 +162,8 @@ class PicoClient:
             if not self._transport_manager.is_initialized:
                 await self._transport_manager.initialize(
                     local_port=self.local_port,
-                    verbose=self.verbose
+                    verbose=self.verbose,
+                    **self.transport_options
                 )
 
             self._idp_range_start, self._idp_range_size = await self._transport_manager.register_device(
@@ -115,14 +171,15 @@ class PicoClient:
                 ip=self.ip,
                 port=self.device_port,
                 response_queue=self._response_queue,
-                event_callbacks=self._event_callbacks
+                event_callbacks=self._event_callbacks,
+                pending=self._pending
             )
 
             self._idp_counter = self._idp_range_start
 
             if self.verbose:
-                _LOGGER.debug(f"✓ Connected '{self.device_id}' to {self.ip}:{self.device_port} (shared transport)")
-                _LOGGER.debug(f"  IDP range: {self._idp_range_start} - {self._idp_range_start + self._idp_range_size - 1}")
+                _LOGGER.debug("✓ Connected '%s' to %s:%s (shared transport)", self.device_id, self.ip, self.device_port)
+                _LOGGER.debug("  IDP range: %s - %s", self._idp_range_start, self._idp_range_start + self._idp_range_size - 1)
 
             self._connected = True
 
@@ -135,6 +192,9 @@ class PicoClient:
         if self.poll_jitter > 0:
             await asyncio.sleep(random.uniform(0, self.poll_jitter))
 
+        if self.sync_idp_on_connect:
+            await self._probe_idp_sync()
+
     async def disconnect(self) -> None:
         """Disconnect from the Pico"""
         if not self._connected:
@@ -144,9 +204,10 @@ class PicoClient:
             await self._transport_manager.unregister_device(self.device_id)
 
         self._connected = False
+        self._last_mode = None
 
         if self.verbose:
-            _LOGGER.debug(f"✓ Disconnected '{self.device_id}'")
+            _LOGGER.debug("✓ Disconnected '%s'", self.device_id)
 
     # ----------------------------
     # PUBLIC API METHODS
@@ -157,21 +218,18 @@ class PicoClient:
         if not self._connected:
             raise PicoConnectionError("Not connected to device")
 
-        cmd = {
-            "cmd": "stato_sync",
-            "frm": "app",
-            "pin": self.pin
-        }
-
-        response = await self._execute_command_with_retry(cmd, retry)
+        response = await self._execute_command_with_retry(self._status_body, retry)
         if not response:
             raise PicoTimeoutError("Failed to get device status")
 
         try:
-            return PicoDeviceModel.from_dict(response)
+            status = PicoDeviceModel.from_dict(response)
         except Exception as e:
             raise PicoDeviceError(f"Failed to parse device status: {e}")
 
+        self._remember_mode(status.operating.mode)
+        return status
+
     async def turn_on(self, retry: bool = True) -> CommandResponseModel:
         """Turn the device on"""
         return await self._set_on_off(True, retry)
@@ -185,19 +243,14 @@ class PicoClient:
         if not self._connected:
             raise PicoConnectionError("Not connected to device")
 
-        mode_value = int(mode)
-
-        cmd = {
-            "mod": mode_value,
-            "on_off": 1,
-            "cmd": "upd_pico",
-            "frm": "app",
-            "pin": self.pin
-        }
+        # Normalized up front so the mode cache only ever holds DeviceModeEnum members
+        mode = DeviceModeEnum(mode)
+        cmd = self._upd_body(_MODE_FIELDS[mode])
 
         result = await self._execute_command_with_retry(cmd, retry)
         if result is None:
             raise PicoTimeoutError("Command timed out")
+        self._remember_mode(mode)
         return CommandResponseModel.from_dict(result)
 
     async def change_fan_speed(self, percentage: int, retry: bool = True, force=False) -> CommandResponseModel:
@@ -205,19 +258,17 @@ class PicoClient:
         if not self._connected:
             raise PicoConnectionError("Not connected to device")
 
+        # Checked up front: the pre-encoded %d field would silently truncate a float
+        if isinstance(percentage, bool) or not isinstance(percentage, int) or not 0 <= percentage <= 100:
+            raise ValueError(f"Fan speed must be an integer from 0 to 100, got {percentage!r}")
+
         if not force:
-            current_status = await self.get_status(retry=retry)
-            if current_status.operating.mode not in MODULAR_FAN_SPEED_PRESET_MODES and percentage != 100:
+            current_mode = await self._current_mode(retry)
+            if current_mode not in MODULAR_FAN_SPEED_PRESET_MODES and percentage != 100:
                 raise NotSupportedError(
-                    f"Current mode {current_status.operating.mode} does not support fan speed control! {percentage}")
-
-        cmd = {
-            "spd_row": percentage,
-            "speed": 0,
-            "cmd": "upd_pico",
-            "frm": "app",
-            "pin": self.pin
-        }
+                    f"Current mode {current_mode} does not support fan speed control! {percentage}")
+
+        cmd = self._upd_body(b'"spd_row":%d,"speed":0' % percentage)
 
         result = await self._execute_command_with_retry(cmd, retry)
         if result is None:
@@ -230,16 +281,11 @@ class PicoClient:
             raise PicoConnectionError("Not connected to device")
 
         if not force:
-            current_status = await self.get_status(retry=retry)
-            if current_status.operating.mode not in MODULAR_FAN_SPEED_PRESET_MODES:
-                raise NotSupportedError(f"Current mode {current_status.operating.mode} does not support night mode!")
-
-        cmd = {
-            "night_mod": 1 if enable else 2,
-            "cmd": "upd_pico",
-            "frm": "app",
-            "pin": self.pin
-        }
+            current_mode = await self._current_mode(retry)
+            if current_mode not in MODULAR_FAN_SPEED_PRESET_MODES:
+                raise NotSupportedError(f"Current mode {current_mode} does not support night mode!")
+
+        cmd = self._night_on_body if enable else self._night_off_body
 
         result = await self._execute_command_with_retry(cmd, retry)
         if result is None:
@@ -251,12 +297,7 @@ class PicoClient:
         if not self._connected:
             raise PicoConnectionError("Not connected to device")
 
-        cmd = {
-            "led_on_off_breve": 1 if enable else 2,
-            "cmd": "upd_pico",
-            "frm": "app",
-            "pin": self.pin
-        }
+        cmd = self._led_on_body if enable else self._led_off_body
 
         result = await self._execute_command_with_retry(cmd, retry)
         if result is None:
@@ -270,17 +311,13 @@ class PicoClient:
             raise PicoConnectionError("Not connected to device")
 
         if not force:
-            current_status = await self.get_status(retry=retry)
-            if current_status.operating.mode not in HUMIDITY_SELECTOR_PRESET_MODES:
+            current_mode = await self._current_mode(retry)
+            if current_mode not in HUMIDITY_SELECTOR_PRESET_MODES:
                 raise NotSupportedError(
-                    f"Current mode {current_status.operating.mode} does not support target humidity selection!")
+                    f"Current mode {current_mode} does not support target humidity selection!")
 
-        cmd = {
-            "s_umd": target_humidity,
-            "cmd": "upd_pico",
-            "frm": "app",
-            "pin": self.pin
-        }
+        fields = _HUMIDITY_FIELDS.get(target_humidity) or b'"s_umd":%d' % int(target_humidity)
+        cmd = self._upd_body(fields)
 
         result = await self._execute_command_with_retry(cmd, retry)
         if result is None:
@@ -312,16 +349,11 @@ class PicoClient:
             man_reset[0] = 1
 
         if self.verbose:
-            _LOGGER.debug(f"→ [{self.device_id}] Resetting filter maintenance")
-            _LOGGER.debug(f"  Current man: {man_status}")
-            _LOGGER.debug(f"  Sending man_reset: {man_reset}")
-
-        cmd = {
-            "man_reset": man_reset,
-            "cmd": "upd_pico",
-            "frm": "app",
-            "pin": self.pin
-        }
+            _LOGGER.debug("→ [%s] Resetting filter maintenance", self.device_id)
+            _LOGGER.debug("  Current man: %s", man_status)
+            _LOGGER.debug("  Sending man_reset: %s", man_reset)
+
+        cmd = self._upd_body(b'"man_reset":' + json_dumps(man_reset))
 
         result = await self._execute_command_with_retry(cmd, retry)
         if result is None:
@@ -379,32 +411,23 @@ class PicoClient:
         if start > end:
             raise ValueError(f"start ({start}) must be <= end ({end})")
 
-        cmd = {
-            "cmd": "stato_sync",
-            "frm": "app",
-            "pin": self.pin,
-        }
-
         responsive: List[int] = []
         probed = 0
 
         async with self._command_lock:
             if self.verbose:
-                _LOGGER.debug(f"🔎 [{self.device_id}] Bruteforcing IDP range {start}-{end} "
-                              f"({per_idp_timeout}s per IDP)")
+                _LOGGER.debug("🔎 [%s] Bruteforcing IDP range %s-%s (%ss per IDP)",
+                              self.device_id, start, end, per_idp_timeout)
 
             for idp in range(start, end + 1):
-                # Drain stale responses from previous probes so they can't be
-                # mistaken for a hit on the current IDP.
-                while not self._response_queue.empty():
-                    try:
-                        self._response_queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        break
-
-                probe = {**cmd, "idp": idp}
-                if not await self._send_udp_packet(probe):
-                    continue
+                # Responses are matched by IDP, so late replies to earlier
+                # probes can't be mistaken for a hit on the current one.
+                self._expect_response(idp)
+                try:
+                    self._send_udp_packet(self._status_body + b',"idp":%d}' % idp, idp)
+                except Exception:
+                    self._discard_pending([idp])
+                    raise
 
                 probed += 1
                 response = await self._wait_for_response(idp, per_idp_timeout)
@@ -412,24 +435,21 @@ class PicoClient:
                 if response:
                     responsive.append(idp)
                     if self.verbose:
-                        _LOGGER.debug(f"✓ [{self.device_id}] Device responded to IDP {idp}")
+                        _LOGGER.debug("✓ [%s] Device responded to IDP %s", self.device_id, idp)
 
                     # Realign the counter so subsequent normal commands resume from here.
-                    async with self._lock:
-                        self._idp_counter = idp + 1
-                        if self._idp_counter >= (self._idp_range_start + self._idp_range_size):
-                            self._idp_counter = self._idp_range_start
+                    self._realign_idp_counter(idp)
 
                     if stop_on_first:
                         break
 
         if self.verbose:
             if responsive:
-                _LOGGER.debug(f"🔎 [{self.device_id}] Bruteforce done: responsive IDP(s) "
-                              f"{responsive} after probing {probed}")
+                _LOGGER.debug("🔎 [%s] Bruteforce done: responsive IDP(s) %s after probing %s",
+                              self.device_id, responsive, probed)
             else:
-                _LOGGER.debug(f"🔎 [{self.device_id}] Bruteforce done: no response after "
-                              f"probing {probed} IDP(s)")
+                _LOGGER.debug("🔎 [%s] Bruteforce done: no response after probing %s IDP(s)",
+                              self.device_id, probed)
 
         return {
             "found": responsive[0] if responsive else None,
@@ -441,160 +461,286 @@ class PicoClient:
     # INTERNAL METHODS
     # ----------------------------
 
-    async def _get_next_idp(self) -> int:
-        """Get next IDP within allocated range"""
-        async with self._lock:
-            idp = self._idp_counter
-            self._idp_counter += 1
+    async def _probe_idp_sync(self) -> bool:
+        """
+        Probe a small window of IDPs from the current counter with a short timeout each.
 
-            # Wrap around within allocated range
-            if self._idp_counter >= (self._idp_range_start + self._idp_range_size):
-                self._idp_counter = self._idp_range_start
+        The first IDP the device answers realigns the counter (see bruteforce_idp);
+        a silent window is not an error, the first real command simply resyncs as usual.
+        """
+        start = self._idp_counter
+        end = min(start + _PROBE_IDP_WINDOW, self._idp_range_start + self._idp_range_size) - 1
+        try:
+            result = await self.bruteforce_idp(start=start, end=end, per_idp_timeout=_PROBE_IDP_TIMEOUT)
+        except OSError as e:
+            if self.verbose:
+                _LOGGER.debug("  ⚠ [%s] Connect-time IDP probe failed: %s", self.device_id, e)
+            return False
 
-            return idp
+        if result["found"] is None:
+            if self.verbose:
+                _LOGGER.debug("  ⚠ [%s] No reply to the connect-time IDP probe", self.device_id)
+            return False
 
-    async def _reset_idp_counter(self) -> None:
-        """Reset IDP counter to start of allocated range"""
-        async with self._lock:
-            old_counter = self._idp_counter
+        if self.verbose:
+            _LOGGER.debug("  ✓ [%s] IDP in sync after connect (next idp:%s)", self.device_id, self._idp_counter)
+        return True
+
+    def _get_next_idp(self) -> int:
+        """
+        Get next IDP within allocated range.
+
+        No lock needed: the body never awaits, so it runs atomically on the event loop.
+        """
+        idp = self._idp_counter
+        self._idp_counter += 1
+
+        # Wrap around within allocated range
+        if self._idp_counter >= (self._idp_range_start + self._idp_range_size):
             self._idp_counter = self._idp_range_start
-            if self.verbose:
-                _LOGGER.debug(f"  ✓ [{self.device_id}] IDP counter reset: {old_counter} → {self._idp_counter}")
 
-    async def _send_udp_packet(self, cmd: Dict[str, Any]) -> bool:
-        """Send a raw UDP packet to the device"""
-        try:
-            data = json.dumps(cmd).encode('utf-8')
-            await self._transport_manager.send_to_device(self.device_id, data)
+        return idp
 
-            if self.verbose:
-                cmd_name = cmd.get('cmd', 'ACK' if cmd.get('res') == 99 else 'unknown')
-                _LOGGER.debug(f"→ [{self.device_id}] SENT: {cmd_name} (idp:{cmd['idp']})")
-                _LOGGER.debug(f"  → [{self.device_id}] Raw command: {data.decode('utf-8')}")
+    def _realign_idp_counter(self, idp: int) -> None:
+        """Continue the IDP sequence right after *idp*, the last value the device answered"""
+        self._idp_counter = idp + 1
+        if self._idp_counter >= (self._idp_range_start + self._idp_range_size):
+            self._idp_counter = self._idp_range_start
+
+    def _reset_idp_counter(self) -> None:
+        """Reset IDP counter to start of allocated range"""
+        old_counter = self._idp_counter
+        self._idp_counter = self._idp_range_start
+        if self.verbose:
+            _LOGGER.debug("  ✓ [%s] IDP counter reset: %s → %s", self.device_id, old_counter, self._idp_counter)
+
+    def _remember_mode(self, mode: DeviceModeEnum) -> None:
+        """Record the device's operating mode as of now"""
+        self._last_mode = mode
+        self._last_mode_ts = time.monotonic()
 
-            return True
+    async def _current_mode(self, retry: bool) -> DeviceModeEnum:
+        """Last known operating mode, refreshed with get_status() once older than mode_cache_ttl"""
+        if self._last_mode is None or time.monotonic() - self._last_mode_ts > self.mode_cache_ttl:
+            await self.get_status(retry=retry)
+        return self._last_mode
 
+    def _upd_body(self, fields: bytes) -> bytes:
+        """Build an ``upd_pico`` command body from its pre-encoded JSON fields"""
+        return b'{' + fields + b',' + self._upd_tail
+
+    def _send_udp_packet(self, data: bytes, idp: int) -> None:
+        """Send an encoded command packet to the device (sendto never blocks, so no await)"""
+        if self.verbose:
+            self._send_udp_packet_verbose(data, idp)
+            return
+        self._transport_manager.send_raw(data, self._addr)
+
+    def _send_udp_packet_verbose(self, data: bytes, idp: int) -> None:
+        """_send_udp_packet with send/error logging"""
+        try:
+            self._transport_manager.send_raw(data, self._addr)
         except Exception as e:
-            if self.verbose:
-                _LOGGER.debug(f"✗ [{self.device_id}] Send error: {e}")
+            _LOGGER.debug("✗ [%s] Send error: %s", self.device_id, e)
             raise
 
+        _LOGGER.debug("→ [%s] SENT (idp:%s)", self.device_id, idp)
+        _LOGGER.debug("  → [%s] Raw command: %s", self.device_id, data.decode('utf-8'))
+
     async def _execute_command_with_retry(
             self,
-            cmd_dict: Dict[str, Any],
+            body: bytes,
             retry: bool = True
     ) -> Optional[Dict[str, Any]]:
         """Execute a command with IDP sync retry logic.
 
-        Serialized via _command_lock to prevent concurrent callers (e.g. the
-        coordinator poll and a user-triggered command) from consuming each
-        other's responses off the shared _response_queue.
+        *body* is the encoded command without its closing brace (see
+        _upd_body); the idp is appended for every send.
+
+        Serialized via _command_lock so concurrent callers (e.g. the
+        coordinator poll and a user-triggered command) don't interleave
+        their IDP sequences and push the device out of sync.
         """
         async with self._command_lock:
             max_attempts = self.retry_attempts if retry else 1
             max_idp_sync = 5
 
-            # Drain any stale responses left over from previous timed-out
-            # commands so they don't interfere with the new exchange.
+            # Awaited responses are delivered through self._pending; drop any
+            # late or unsolicited packets that piled up in the queue meanwhile.
             while not self._response_queue.empty():
                 try:
                     self._response_queue.get_nowait()
                 except asyncio.QueueEmpty:
                     break
 
-            for attempt in range(1, max_attempts + 1):
-                if attempt > 1:
-                    if self.verbose:
-                        _LOGGER.debug(f"↻ [{self.device_id}] Retry {attempt}/{max_attempts}")
-                    await asyncio.sleep(self.retry_delay)
+            # One flat loop over (attempt, idp_sync_attempt): each pass sends one
+            # batch of IDP candidates, an exhausted attempt rolls over to the next.
+            if max_attempts < 1:
+                return None
 
-                for idp_sync_attempt in range(max_idp_sync):
-                    if idp_sync_attempt > 0 and self.verbose:
-                        _LOGGER.debug(f"  ↻ [{self.device_id}] IDP sync attempt {idp_sync_attempt}/{max_idp_sync}")
+            attempt = 1
+            idp_sync_attempt = 0
+            while True:
+                if idp_sync_attempt >= max_idp_sync:
+                    if attempt >= max_attempts:
+                        return None
 
-                    idp = await self._get_next_idp()
-                    cmd = {**cmd_dict, "idp": idp}
+                    # After all IDP sync attempts failed, reset IDP counter
+                    if self.verbose:
+                        _LOGGER.debug("  ⟲ [%s] Resetting IDP counter to range start", self.device_id)
+                    self._reset_idp_counter()
 
-                    if not await self._send_udp_packet(cmd):
-                        continue
+                    attempt += 1
+                    idp_sync_attempt = 0
+                    if self.verbose:
+                        _LOGGER.debug("↻ [%s] Retry %s/%s", self.device_id, attempt, max_attempts)
+                elif idp_sync_attempt >= 2:
+                    # A stale IDP is resynced right away; only later candidates back off (bounded)
+                    await asyncio.sleep(min(_IDP_SYNC_BACKOFF * 2 ** (idp_sync_attempt - 2), _IDP_SYNC_BACKOFF_MAX))
+
+                if idp_sync_attempt > 0 and self.verbose:
+                    _LOGGER.debug("  ↻ [%s] IDP sync attempt %s/%s", self.device_id, idp_sync_attempt, max_idp_sync)
+
+                # The first candidate of an attempt always goes out alone: a device that is
+                # in sync would act on every candidate of a batch. Batch only after a miss.
+                if idp_sync_attempt == 0:
+                    batch = 1
+                else:
+                    batch = min(self.idp_sync_batch, max_idp_sync - idp_sync_attempt)
+                first_attempt = idp_sync_attempt
+                idp_sync_attempt += batch
+
+                idps = []
+                try:
+                    for _ in range(batch):
+                        idp = self._get_next_idp()
+                        # Register before sending so a fast reply can't slip past us
+                        self._expect_response(idp)
+                        idps.append(idp)
+                        self._send_udp_packet(body + b',"idp":%d}' % idp, idp)
+                except OSError:
+                    # A send error is a connection problem, not an IDP one: end this attempt.
+                    # The last attempt lets it reach the caller (and auto_reconnect) right away.
+                    self._discard_pending(idps)
+                    if attempt >= max_attempts:
+                        raise
+                    await asyncio.sleep(self.retry_delay)
+                    idp_sync_attempt = max_idp_sync
+                    continue
+                except Exception:
+                    # e.g. RuntimeError once the shared transport is shut down
+                    self._discard_pending(idps)
+                    raise
 
+                if len(idps) == 1:
+                    idp = idps[0]
                     response = await self._wait_for_response(idp, self.timeout)
+                else:
+                    idp, response = await self._wait_for_first_response(idps, self.timeout)
 
-                    if response:
-                        if idp_sync_attempt > 0 and self.verbose:
-                            _LOGGER.debug(f"  ✓ [{self.device_id}] IDP synchronized after {idp_sync_attempt} increments")
-                        return response
+                if response:
+                    increments = first_attempt + idps.index(idp)
+                    if increments > 0 and self.verbose:
+                        _LOGGER.debug("  ✓ [%s] IDP synchronized after %s increments", self.device_id, increments)
+                    # The device may have answered every candidate up to the last one sent,
+                    # so continue after the highest; this also keeps late replies to the other
+                    # candidates from landing on the next command's IDPs
+                    self._realign_idp_counter(idps[-1])
+                    # upd_pico replies carry the device state too; keep the mode guard cache warm
+                    mode = mode_from_value(response.get("mod"))
+                    if mode is not None:
+                        self._remember_mode(mode)
+                    return response
 
-                    # If no response after timeout, IDP is likely out of sync
-                    if self.verbose:
-                        _LOGGER.debug(f"  ⚠ [{self.device_id}] No response for IDP {idp} - likely out of sync")
+                # If no response after timeout, IDP is likely out of sync
+                if self.verbose:
+                    _LOGGER.debug("  ⚠ [%s] No response for IDP(s) %s - likely out of sync", self.device_id, idps)
 
-                # After all IDP sync attempts failed, reset IDP counter
-                if attempt < max_attempts:
-                    if self.verbose:
-                        _LOGGER.debug(f"  ⟲ [{self.device_id}] Resetting IDP counter to range start")
-                    await self._reset_idp_counter()
+    def _expect_response(self, idp: int) -> Tuple[asyncio.Future, asyncio.Future]:
+        """Register futures that the transport resolves when the ACK / response for *idp* arrives"""
+        loop = asyncio.get_running_loop()
+        waiter = (loop.create_future(), loop.create_future())
+        self._pending[idp] = waiter
+        return waiter
+
+    def _discard_pending(self, idps: List[int]) -> None:
+        """Stop waiting for replies to *idps*"""
+        for idp in idps:
+            waiter = self._pending.pop(idp, None)
+            if waiter is not None:
+                for future in waiter:
+                    future.cancel()
+
+    async def _wait_for_first_response(
+            self,
+            idps: List[int],
+            timeout: float
+    ) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+        """Wait on several in-flight IDPs and return the first ``(idp, response)`` that completes"""
 
-            return None
+        async def wait_one(idp: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+            return idp, await self._wait_for_response(idp, timeout)
+
+        tasks = [asyncio.ensure_future(wait_one(idp)) for idp in idps]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                idp, response = await next_done
+                if response:
+                    return idp, response
+            return None, None
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Drop the losers' waiters right away, before their cancelled tasks get to run,
+            # so late replies to them fall through to the response queue
+            self._discard_pending(idps)
 
     async def _wait_for_response(self, idp: int, timeout: float) -> Optional[Dict[str, Any]]:
-        """Wait for responses matching the given idp"""
+        """Wait for the response matching the given idp"""
         loop = asyncio.get_running_loop()
-        got_ack = False
         end_time = loop.time() + timeout
         ack_timeout = 2.0
-        ack_received_time: Optional[float] = None
+        waiter = self._pending.get(idp) or self._expect_response(idp)
+        ack_future, response_future = waiter
 
-        while loop.time() < end_time:
-            remaining = end_time - loop.time()
-            if remaining <= 0:
-                break
+        try:
+            await asyncio.wait(waiter, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
 
-            if got_ack and ack_received_time is not None:
-                if loop.time() - ack_received_time > ack_timeout:
-                    if self.verbose:
-                        _LOGGER.debug(f"  ⚠ [{self.device_id}] ACK received but no status - IDP may be out of sync")
+            if not response_future.done():
+                if not ack_future.done():
                     return None
 
-            try:
-                response, addr = await asyncio.wait_for(
-                    self._response_queue.get(),
-                    timeout=min(remaining, 0.5)
-                )
-
-                if response.get("idp") != idp:
-                    continue
-
-                if response.get("res") == 99 and response.get("frm") == "mst":
-                    if self.verbose:
-                        _LOGGER.debug(f"  ✓ [{self.device_id}] ACK received (idp:{idp})")
-                    got_ack = True
-                    ack_received_time = loop.time()
+                if self.verbose:
+                    _LOGGER.debug("  ✓ [%s] ACK received (idp:%s)", self.device_id, idp)
 
-                elif response.get("res") != 99:
+                # The device ACKed, so the status should follow shortly
+                remaining = min(ack_timeout, end_time - loop.time())
+                if remaining > 0:
+                    await asyncio.wait((response_future,), timeout=remaining)
+                if not response_future.done():
                     if self.verbose:
-                        _LOGGER.debug(f"  ✓ [{self.device_id}] Response received (idp:{idp})")
+                        _LOGGER.debug("  ⚠ [%s] ACK received but no status - IDP may be out of sync", self.device_id)
+                    return None
 
-                    ack = {"idp": idp, "frm": "app", "res": 99}
-                    await self._send_udp_packet(ack)
-                    return response
+            response = response_future.result()
+            if self.verbose:
+                _LOGGER.debug("  ✓ [%s] Response received (idp:%s)", self.device_id, idp)
 
-            except asyncio.TimeoutError:
-                continue
+            # The transport protocol already sent the client ACK for this status
+            return response
 
-        return None
+        finally:
+            if self._pending.get(idp) is waiter:
+                del self._pending[idp]
+            for future in waiter:
+                future.cancel()
 
     async def _set_on_off(self, turn_on: bool, retry: bool = True) -> CommandResponseModel:
         """Turn the device on or off"""
         if not self._connected:
             raise PicoConnectionError("Not connected to device")
 
-        cmd = {
-            "on_off": 1 if turn_on else 2,
-            "cmd": "upd_pico",
-            "frm": "app",
-            "pin": self.pin
-        }
+        cmd = self._turn_on_body if turn_on else self._turn_off_body
 
         result = await self._execute_command_with_retry(cmd, retry)
         if result is None:
@@ -5,29 +5,60 @@ Allows multiple PicoClient instances to share a single UDP socket by routing
 responses based on IDP ranges assigned to each device.
 """
 
-import bisect
 import logging
 import asyncio
+import heapq
 import inspect
-import json
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import re
+import socket
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 
 from open_pico_local_api.exceptions.pico_connection_error import PicoConnectionError
+from open_pico_local_api.utils.json_codec import JSONDecodeError, json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# Socket buffer sizes requested for the shared socket (the kernel may cap them).
+# The receive side is sized for bursts of status frames from many devices.
+DEFAULT_RCVBUF = 1 << 20
+DEFAULT_SNDBUF = 1 << 18
 
-@dataclass
+# The socket module does not export SO_BUSY_POLL; 46 is its value in the generic Linux ABI
+_SO_BUSY_POLL = getattr(socket, "SO_BUSY_POLL", 46 if sys.platform.startswith("linux") else None)
+
+# Client ACK sent back for every status a waiting command consumes
+_ACK_TEMPLATE = b'{"idp":%d,"frm":"app","res":99}'
+
+# Cheap pre-scan of the IDP so packets nobody owns are dropped before the full JSON decode
+_IDP_RE = re.compile(rb'"idp"\s*:\s*(\d+)')
+
+
+def _classify_callbacks(callbacks: Optional[Dict]) -> Dict[str, Tuple[bool, Callable]]:
+    """Map cmd -> (is_coroutine_function, callback) so dispatch does not re-inspect per packet"""
+    return {cmd: (inspect.iscoroutinefunction(cb), cb) for cmd, cb in (callbacks or {}).items()}
+
+
+@dataclass(slots=True)
 class DeviceRegistration:
     """Registration info for a device"""
     device_id: str
     ip: str
     port: int
     response_queue: asyncio.Queue
-    event_callbacks: Dict
+    event_callbacks: Dict[str, Tuple[bool, Callable]]  # cmd -> (is_coro, callback)
     idp_range_start: int
     idp_range_size: int  # Number of IDPs allocated to this device
+    # idp -> (ack_future, response_future) for commands awaiting a reply
+    pending: Dict[int, Tuple[asyncio.Future, asyncio.Future]] = field(default_factory=dict)
+    # Addresses *ip* resolved to at registration; None when it could not be resolved
+    hosts: Optional[frozenset] = None
+    # (ip, port) built once; ip and port must not be changed after registration
+    addr: Tuple[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.addr = (self.ip, self.port)
 
 
 class SharedPicoProtocol(asyncio.DatagramProtocol):
@@ -43,65 +74,117 @@ class SharedPicoProtocol(asyncio.DatagramProtocol):
         self.transport_manager._transport = transport
 
     def datagram_received(self, data, addr):
+        manager = self.transport_manager  # Bound once: read several times per packet
+        verbose = self.verbose
+        match = _IDP_RE.search(data)
+        if match is not None and manager.unmatched_queue is None:
+            idp = int(match.group(1))
+            if manager.find_registration_by_idp(idp) is None:
+                manager._dropped_packets += 1
+                if verbose:
+                    _LOGGER.debug("⚠ No device found for IDP %s", idp)
+                return
+
         try:
-            response = json.loads(data.decode('utf-8'))
-            _LOGGER.debug(response)
+            response = json_loads(data)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(response)
 
-            if self.verbose:
-                idp = response.get('idp', '?')
-                cmd = response.get('cmd', 'unknown')
-                _LOGGER.debug(f"← RECV from {addr}: cmd={cmd}, idp={idp}")
-                _LOGGER.debug(f"  ← RECV from {addr}: Raw response: {data.decode('utf-8')}")
+            if verbose:
+                _LOGGER.debug("← RECV from %s: cmd=%s, idp=%s",
+                              addr, response.get('cmd', 'unknown'), response.get('idp', '?'))
+                _LOGGER.debug("  ← RECV from %s: Raw response: %s", addr, data.decode('utf-8'))
 
             # Route response to correct device based on IDP
             idp = response.get('idp')
             if idp is not None:
-                device_id = self.transport_manager.find_device_by_idp(idp)
-                if device_id:
-                    registration = self.transport_manager.get_device_registration(device_id)
-                    # Put in device's response queue
-                    registration.response_queue.put_nowait((response, addr))
-
-                    # Trigger callbacks if any
-                    cmd = response.get('cmd', '')
-                    if cmd in registration.event_callbacks:
-                        callback = registration.event_callbacks[cmd]
-                        asyncio.create_task(self._run_callback(callback, response))
+                registration = manager.find_registration_by_idp(idp)
+                if registration is not None and registration.hosts is not None \
+                        and addr[0] not in registration.hosts:
+                    # IDP ranges are recycled, so a late packet from the range's previous
+                    # owner must not reach the device that holds it now. Only the host is
+                    # compared: devices may reply from a port other than the one we send to
+                    registration = None
+                if registration is not None:
+                    # Hand the packet straight to the waiting command, or queue it if nobody awaits it
+                    waiter = registration.pending.get(idp)
+                    if waiter is None or not self._resolve_waiter(waiter, response):
+                        try:
+                            registration.response_queue.put_nowait((response, addr))
+                        except asyncio.QueueFull:
+                            # Bounded queue of late / unsolicited packets: drop rather than grow
+                            manager._dropped_packets += 1
+                    elif response.get('res') != 99 and self.transport is not None:
+                        # ACK the status right here so the caller does not pay for the send
+                        self.transport.sendto(_ACK_TEMPLATE % idp, addr)
+
+                    # Trigger callbacks if any; cmd is only read when some are registered
+                    callbacks = registration.event_callbacks
+                    if callbacks:
+                        entry = callbacks.get(response.get('cmd', ''))
+                        if entry is not None:
+                            is_coro, callback = entry
+                            if is_coro:
+                                asyncio.create_task(self._run_callback(callback, response))
+                            else:
+                                # Sync callbacks run inline: no coroutine or Task per packet
+                                self._call_callback(callback, response)
                 else:
-                    unmatched_queue = self.transport_manager.unmatched_queue
+                    unmatched_queue = manager.unmatched_queue
                     if unmatched_queue is not None:
                         unmatched_queue.put_nowait((response, addr))
-                    elif self.verbose:
-                        _LOGGER.debug(f"⚠ No device found for IDP {idp}")
+                    else:
+                        manager._dropped_packets += 1
+                        if verbose:
+                            _LOGGER.debug("⚠ No device found for IDP %s", idp)
             else:
-                if self.verbose:
-                    _LOGGER.debug(f"⚠ Response without IDP: {response}")
+                if verbose:
+                    _LOGGER.debug("⚠ Response without IDP: %s", response)
 
-        except json.JSONDecodeError as e:
-            if self.verbose:
-                _LOGGER.warning(f"⚠ JSON decode error: {e}")
+        except JSONDecodeError as e:
+            if verbose:
+                _LOGGER.warning("⚠ JSON decode error: %s", e)
         except Exception as e:
-            if self.verbose:
-                _LOGGER.warning(f"⚠ Error processing datagram: {e}")
+            if verbose:
+                _LOGGER.warning("⚠ Error processing datagram: %s", e)
+
+    @staticmethod
+    def _resolve_waiter(waiter: Tuple[asyncio.Future, asyncio.Future], response: Dict) -> bool:
+        """Complete the ACK or response future of *waiter*; return False if the packet was not consumed."""
+        ack_future, response_future = waiter
+        if response.get('res') == 99:
+            if response.get('frm') == 'mst' and not ack_future.done():
+                ack_future.set_result(response)
+                return True
+            return False
+        if not response_future.done():
+            response_future.set_result(response)
+            return True
+        return False
+
+    @staticmethod
+    def _call_callback(callback, response):
+        """Run a sync callback without letting its errors reach the transport"""
+        try:
+            callback(response)
+        except Exception as e:
+            _LOGGER.warning("⚠ Callback error: %s", e)
 
     @staticmethod
     async def _run_callback(callback, response):
-        """Run callback in async context"""
+        """Run a coroutine callback in its own task without letting its errors escape"""
         try:
-            if inspect.iscoroutinefunction(callback):
-                await callback(response)
-            else:
-                callback(response)
+            await callback(response)
         except Exception as e:
-            _LOGGER.warning(f"⚠ Callback error: {e}")
+            _LOGGER.warning("⚠ Callback error: %s", e)
 
     def error_received(self, exc):
         if self.verbose:
-            _LOGGER.warning(f"⚠ Protocol error: {exc}")
+            _LOGGER.warning("⚠ Protocol error: %s", exc)
 
     def connection_lost(self, exc):
         if self.verbose and exc:
-            _LOGGER.warning(f"⚠ Connection lost: {exc}")
+            _LOGGER.warning("⚠ Connection lost: %s", exc)
 
 
 class SharedTransportManager:
@@ -137,10 +220,12 @@ class SharedTransportManager:
         self._idp_range_size = 10000  # Allocate 10k IDPs per device
         self._init_lock = asyncio.Lock()  # Lock for thread-safe initialization and registration
         self._unmatched_queue: Optional[asyncio.Queue] = None  # Receives packets with no registered IDP owner
+        self._dropped_packets = 0  # Packets discarded: unowned IDP or full response queue
 
-        # O(log n) IDP routing structures
-        self._idp_sorted_starts: List[int] = []          # Sorted range-start values
-        self._idp_start_to_device: Dict[int, str] = {}   # range_start → device_id
+        # O(1) IDP routing: slot (idp - 1) // _idp_range_size → registration (None once unregistered).
+        # The receive path indexes this list directly; _devices stays for lookups by device_id.
+        self._range_index: List[Optional[DeviceRegistration]] = []
+        self._free_slots: List[int] = []  # Min-heap of slots released by unregister_device
 
     @classmethod
     async def get_instance(cls):
@@ -150,19 +235,30 @@ class SharedTransportManager:
                 cls._instance = cls()
         return cls._instance
 
-    async def initialize(self, local_port: int = 40069, verbose: bool = False):
+    async def initialize(
+        self,
+        local_port: int = 40069,
+        verbose: bool = False,
+        rcvbuf: Optional[int] = DEFAULT_RCVBUF,
+        sndbuf: Optional[int] = DEFAULT_SNDBUF,
+        busy_poll_us: Optional[int] = None
+    ):
         """
         Initialize the shared UDP transport
 
         Args:
             local_port: Local port to bind to
             verbose: Enable verbose logging
+            rcvbuf: SO_RCVBUF size for the shared socket (None keeps the OS default)
+            sndbuf: SO_SNDBUF size for the shared socket (None keeps the OS default)
+            busy_poll_us: Linux only: SO_BUSY_POLL time in microseconds, spinning in the
+                kernel for replies instead of waiting for the interrupt (None disables)
         """
         # Thread-safe initialization check
         async with self._init_lock:
             if self._initialized:
                 if verbose:
-                    _LOGGER.debug(f"ℹ Shared transport already initialized on port {self._local_port}")
+                    _LOGGER.debug("ℹ Shared transport already initialized on port %s", self._local_port)
                 return
 
             self._local_port = local_port
@@ -174,21 +270,45 @@ class SharedTransportManager:
                     lambda: SharedPicoProtocol(self, verbose),
                     local_addr=("0.0.0.0", local_port)
                 )
+                self._tune_socket(rcvbuf, sndbuf, busy_poll_us)
                 self._initialized = True
 
                 if verbose:
-                    _LOGGER.debug(f"✓ Shared transport initialized on port {local_port}")
+                    _LOGGER.debug("✓ Shared transport initialized on port %s", local_port)
 
             except Exception as e:
                 raise PicoConnectionError(f"Failed to initialize shared transport: {e}")
 
+    def _tune_socket(
+        self,
+        rcvbuf: Optional[int],
+        sndbuf: Optional[int],
+        busy_poll_us: Optional[int] = None
+    ) -> None:
+        """Apply the socket options; failures are not fatal, the OS defaults still work"""
+        sock = self._transport.get_extra_info('socket')
+        if sock is None:
+            return
+        options = [(socket.SO_RCVBUF, rcvbuf), (socket.SO_SNDBUF, sndbuf)]
+        if _SO_BUSY_POLL is not None:
+            options.append((_SO_BUSY_POLL, busy_poll_us))
+        for option, value in options:
+            if value is None:
+                continue
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, option, value)
+            except OSError as e:
+                if self._verbose:
+                    _LOGGER.debug("⚠ Could not set socket option %s=%s: %s", option, value, e)
+
     async def register_device(
         self,
         device_id: str,
         ip: str,
         port: int,
         response_queue: asyncio.Queue,
-        event_callbacks: Optional[Dict] = None
+        event_callbacks: Optional[Dict] = None,
+        pending: Optional[Dict[int, Tuple[asyncio.Future, asyncio.Future]]] = None
     ) -> Tuple[int, int]:
         """
         Register a device to use the shared transport
@@ -197,8 +317,11 @@ class SharedTransportManager:
             device_id: Unique identifier for the device
             ip: Device IP address
             port: Device port
-            response_queue: Queue to receive responses
-            event_callbacks: Optional event callbacks
+            response_queue: Queue to receive responses nobody is waiting for
+            event_callbacks: Optional map of cmd -> callback; classified as sync or
+                coroutine once here, so later changes to the dict are not picked up
+            pending: Optional map of idp -> (ack_future, response_future) that
+                awaited responses are delivered to directly
 
         Returns:
             Tuple of (idp_range_start, idp_range_size)
@@ -206,6 +329,8 @@ class SharedTransportManager:
         if not self._initialized:
             raise RuntimeError("Transport not initialized. Call initialize() first.")
 
+        hosts = await self._resolve_hosts(ip, port)
+
         async with self._init_lock:
             if device_id in self._devices:
                 # Already registered — update the response queue and callbacks so that a
@@ -214,71 +339,88 @@ class SharedTransportManager:
                 reg = self._devices[device_id]
                 reg.response_queue = response_queue
                 if event_callbacks:
-                    reg.event_callbacks = event_callbacks
+                    reg.event_callbacks = _classify_callbacks(event_callbacks)
+                if pending is not None:
+                    reg.pending = pending
                 return reg.idp_range_start, reg.idp_range_size
 
-            # Allocate IDP range for this device (protected by lock to prevent races)
-            idp_range_start = self._next_idp_range
-            self._next_idp_range += self._idp_range_size
+            # Allocate IDP range for this device (protected by lock to prevent races).
+            # Reuse the lowest slot freed by an unregister before growing the index.
+            if self._free_slots:
+                slot = heapq.heappop(self._free_slots)
+                idp_range_start = slot * self._idp_range_size + 1
+            else:
+                slot = len(self._range_index)
+                idp_range_start = self._next_idp_range
+                self._next_idp_range += self._idp_range_size
+                self._range_index.append(None)
 
             registration = DeviceRegistration(
                 device_id=device_id,
                 ip=ip,
                 port=port,
                 response_queue=response_queue,
-                event_callbacks=event_callbacks or {},
+                event_callbacks=_classify_callbacks(event_callbacks),
                 idp_range_start=idp_range_start,
-                idp_range_size=self._idp_range_size
+                idp_range_size=self._idp_range_size,
+                pending=pending if pending is not None else {},
+                hosts=hosts
             )
 
             self._devices[device_id] = registration
-            bisect.insort(self._idp_sorted_starts, idp_range_start)
-            self._idp_start_to_device[idp_range_start] = device_id
+            self._range_index[slot] = registration
 
         if self._verbose:
-            _LOGGER.debug(f"✓ Registered device '{device_id}' at {ip}:{port}")
-            _LOGGER.debug(f"  IDP range: {idp_range_start} - {idp_range_start + self._idp_range_size - 1}")
+            _LOGGER.debug("✓ Registered device '%s' at %s:%s", device_id, ip, port)
+            _LOGGER.debug("  IDP range: %s - %s", idp_range_start, idp_range_start + self._idp_range_size - 1)
 
         return idp_range_start, self._idp_range_size
 
+    @staticmethod
+    async def _resolve_hosts(ip: str, port: int) -> Optional[frozenset]:
+        """Resolve *ip* (address or hostname) to the IPv4 addresses replies can come from."""
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                ip, port, family=socket.AF_INET, type=socket.SOCK_DGRAM
+            )
+        except OSError as e:
+            # Leave the source unchecked rather than drop every reply of the device
+            _LOGGER.debug("Could not resolve %s: %s", ip, e)
+            return None
+        return frozenset(info[4][0] for info in infos)
+
     async def unregister_device(self, device_id: str):
         """Unregister a device"""
         if device_id in self._devices:
             reg = self._devices.pop(device_id)
-            start = reg.idp_range_start
-            self._idp_start_to_device.pop(start, None)
-            idx = bisect.bisect_left(self._idp_sorted_starts, start)
-            if idx < len(self._idp_sorted_starts) and self._idp_sorted_starts[idx] == start:
-                self._idp_sorted_starts.pop(idx)
+            slot = (reg.idp_range_start - 1) // reg.idp_range_size
+            self._range_index[slot] = None
+            heapq.heappush(self._free_slots, slot)
             if self._verbose:
-                _LOGGER.debug(f"✓ Unregistered device '{device_id}'")
+                _LOGGER.debug("✓ Unregistered device '%s'", device_id)
 
-    def find_device_by_idp(self, idp: int) -> Optional[str]:
-        """Find which device an IDP belongs to — O(log n) via bisect."""
-        if not self._idp_sorted_starts:
-            return None
-        idx = bisect.bisect_right(self._idp_sorted_starts, idp) - 1
-        if idx < 0:
-            return None
-        start = self._idp_sorted_starts[idx]
-        device_id = self._idp_start_to_device.get(start)
-        if device_id is None:
-            return None
-        reg = self._devices[device_id]
-        if idp < start + reg.idp_range_size:
-            return device_id
+    def find_registration_by_idp(self, idp: int) -> Optional[DeviceRegistration]:
+        """Find the registration owning an IDP — O(1) via the range slot index."""
+        slot = (idp - 1) // self._idp_range_size
+        if 0 <= slot < len(self._range_index):
+            return self._range_index[slot]
         return None
 
+    def find_device_by_idp(self, idp: int) -> Optional[str]:
+        """Find which device an IDP belongs to."""
+        registration = self.find_registration_by_idp(idp)
+        return registration.device_id if registration is not None else None
+
     async def send_to_device(self, device_id: str, data: bytes):
         """Send data to a specific device"""
         if device_id not in self._devices:
             raise ValueError(f"Device '{device_id}' not registered")
 
         registration = self._devices[device_id]
-        self._transport.sendto(data, (registration.ip, registration.port))
+        self._transport.sendto(data, registration.addr)
 
         if self._verbose:
-            _LOGGER.debug(f"→ SENT to {device_id} ({registration.ip}:{registration.port})")
+            _LOGGER.debug("→ SENT to %s (%s:%s)", device_id, registration.ip, registration.port)
 
     def send_raw(self, data: bytes, addr: Tuple[str, int]) -> None:
         """Send raw bytes to an arbitrary address (used by discovery)."""
@@ -310,8 +452,8 @@ class SharedTransportManager:
             self._transport = None
             self._initialized = False
             self._devices.clear()
-            self._idp_sorted_starts.clear()
-            self._idp_start_to_device.clear()
+            self._range_index.clear()
+            self._free_slots.clear()
             self._next_idp_range = 1
             self._unmatched_queue = None
 
@@ -321,6 +463,11 @@ class SharedTransportManager:
             if self._verbose:
                 _LOGGER.debug("✓ Shared transport closed")
 
+    @property
+    def dropped_packets(self) -> int:
+        """Number of packets discarded: no registered device owns their IDP, or its queue was full."""
+        return self._dropped_packets
+
     @property
     def is_initialized(self) -> bool:
         """Check if transport is initialized"""
@@ -4,6 +4,10 @@ from functools import wraps
 from open_pico_local_api.exceptions.pico_connection_error import PicoConnectionError
 
 
+# Failures that trigger a reconnect; anything else propagates untouched
+_RECONNECTABLE_ERRORS = (PicoConnectionError, OSError)
+
+
 def auto_reconnect(func):
     """
     Decorator to automatically reconnect on connection failures.
@@ -18,8 +22,22 @@ def auto_reconnect(func):
             return await func(self, *args, **kwargs)
 
         max_attempts = self._max_reconnect_attempts
+        first_error = None
+
+        # Fast path: already connected and the call succeeds, no retry loop entered
+        if self._connected and max_attempts > 0:
+            try:
+                return await func(self, *args, **kwargs)
+            except _RECONNECTABLE_ERRORS as e:
+                first_error = e
 
         for attempt in range(max_attempts):
+            if first_error is not None:
+                # The fast path already spent attempt 0
+                error, first_error = first_error, None
+                await _recover(self, func.__name__, attempt, max_attempts, error)
+                continue
+
             try:
                 if not self._connected:
                     if self.verbose:
@@ -28,37 +46,39 @@ def auto_reconnect(func):
 
                 return await func(self, *args, **kwargs)
 
-            except (PicoConnectionError, OSError) as e:
-                if attempt < max_attempts - 1:
-                    if self.verbose:
-                        print(f"⚠ Connection lost during {func.__name__}, reconnecting... ({attempt + 1}/{max_attempts})")
-
-                    try:
-                        await self.disconnect()
-                    except (PicoConnectionError, OSError):
-                        pass
-
-                    await asyncio.sleep(self._reconnect_delay)
-
-                    try:
-                        await self.connect()
-                        if self.verbose:
-                            print(f"✓ Reconnected successfully")
-                    except Exception as reconnect_error:
-                        if self.verbose:
-                            print(f"✗ Reconnection attempt {attempt + 1} failed: {reconnect_error}")
-                        if attempt == max_attempts - 2:
-                            raise PicoConnectionError(
-                                f"Failed to reconnect after {max_attempts} attempts. Last error: {reconnect_error}"
-                            )
-                else:
-                    raise PicoConnectionError(
-                        f"Failed after {max_attempts} reconnection attempts. Last error: {e}"
-                    )
-
-            except Exception:
-                raise
+            except _RECONNECTABLE_ERRORS as e:
+                await _recover(self, func.__name__, attempt, max_attempts, e)
 
         return None
 
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+
+async def _recover(client, name: str, attempt: int, max_attempts: int, error: Exception) -> None:
+    """Reconnect after a failed attempt, or raise once the attempts are used up"""
+    if attempt < max_attempts - 1:
+        if client.verbose:
+            print(f"⚠ Connection lost during {name}, reconnecting... ({attempt + 1}/{max_attempts})")
+
+        try:
+            await client.disconnect()
+        except _RECONNECTABLE_ERRORS:
+            pass
+
+        await asyncio.sleep(client._reconnect_delay)
+
+        try:
+            await client.connect()
+            if client.verbose:
+                print(f"✓ Reconnected successfully")
+        except Exception as reconnect_error:
+            if client.verbose:
+                print(f"✗ Reconnection attempt {attempt + 1} failed: {reconnect_error}")
+            if attempt == max_attempts - 2:
+                raise PicoConnectionError(
+                    f"Failed to reconnect after {max_attempts} attempts. Last error: {reconnect_error}"
+                )
+    else:
+        raise PicoConnectionError(
+            f"Failed after {max_attempts} reconnection attempts. Last error: {error}"
+        )
\ No newline at end of file
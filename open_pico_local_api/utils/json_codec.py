@@ -0,0 +1,39 @@
+"""
+JSON codec for UDP payloads.
+
+Uses orjson (C extension, bytes in / bytes out) when it is installed and
+falls back to the stdlib json module otherwise, so the library keeps
+working without third-party dependencies.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+HAS_ORJSON = orjson is not None
+
+
+if orjson is not None:
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize *obj* to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON from bytes (or str)."""
+        return orjson.loads(data)
+
+else:
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize *obj* to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON from bytes (or str)."""
+        return json.loads(data)
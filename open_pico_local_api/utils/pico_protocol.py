@@ -1,8 +1,12 @@
 import asyncio
 import inspect
-import json
+import logging
 from typing import Dict, Callable, Any
 
+from open_pico_local_api.utils.json_codec import JSONDecodeError, json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
 
 class PicoProtocol(asyncio.DatagramProtocol):
     """Internal protocol for handling UDP datagrams"""
@@ -10,6 +14,8 @@ class PicoProtocol(asyncio.DatagramProtocol):
     def __init__(self, response_queue: asyncio.Queue, event_callbacks: Dict[str, Callable], verbose: bool):
         self.response_queue = response_queue
         self.event_callbacks = event_callbacks
+        # cmd -> (is_coro, callback), classified once instead of per packet
+        self._callbacks = {cmd: (inspect.iscoroutinefunction(cb), cb) for cmd, cb in event_callbacks.items()}
         self.verbose = verbose
         self.transport = None
 
@@ -18,39 +24,51 @@ class PicoProtocol(asyncio.DatagramProtocol):
 
     def datagram_received(self, data, addr):
         try:
-            response = json.loads(data.decode('utf-8'))
+            response = json_loads(data)
             if self.verbose:
-                print(f"← RECV: {response.get('res', response.get('cmd', 'unknown'))}")
-                print(f"  ← RECV: Raw response: {data.decode('utf-8')}")
+                _LOGGER.debug("← RECV: %s", response.get('res', response.get('cmd', 'unknown')))
+                _LOGGER.debug("  ← RECV: Raw response: %s", data.decode('utf-8'))
 
             # Put response in queue immediately (sync-safe)
             self.response_queue.put_nowait((response, addr))
 
-            # Trigger event callbacks
-            cmd = response.get('cmd', '')
-            if cmd in self.event_callbacks:
-                asyncio.create_task(self._run_callback(cmd, response))
+            # Trigger event callbacks: sync ones inline, coroutines in their own task
+            # (cmd is only read when some callbacks are registered)
+            callbacks = self._callbacks
+            if callbacks:
+                cmd = response.get('cmd', '')
+                entry = callbacks.get(cmd)
+                if entry is not None:
+                    is_coro, callback = entry
+                    if is_coro:
+                        asyncio.create_task(self._run_callback(cmd, callback, response))
+                    else:
+                        self._call_callback(cmd, callback, response)
+
+        except JSONDecodeError as e:
+            if self.verbose:
+                _LOGGER.warning("⚠ JSON decode error: %s", e)
 
-        except json.JSONDecodeError as e:
+    def _call_callback(self, cmd: str, callback: Callable, response: Dict[str, Any]):
+        """Run a sync callback without letting its errors reach the transport"""
+        try:
+            callback(response)
+        except Exception as e:
             if self.verbose:
-                print(f"⚠ JSON decode error: {e}")
+                _LOGGER.warning("⚠ Callback error for %s: %s", cmd, e)
 
-    async def _run_callback(self, cmd: str, response: Dict[str, Any]):
-        """Run callback in async context"""
+    async def _run_callback(self, cmd: str, callback: Callable, response: Dict[str, Any]):
+        """Run a coroutine callback in async context"""
         try:
-            callback = self.event_callbacks[cmd]
-            if inspect.iscoroutinefunction(callback):
-                await callback(response)
-            else:
-                callback(response)
+            await callback(response)
         except Exception as e:
             if self.verbose:
-                print(f"⚠ Callback error for {cmd}: {e}")
+                _LOGGER.warning("⚠ Callback error for %s: %s", cmd, e)
 
     def error_received(self, exc):
         if self.verbose:
-            print(f"⚠ Protocol error: {exc}")
+            _LOGGER.warning("⚠ Protocol error: %s", exc)
 
     def connection_lost(self, exc):
         if self.verbose and exc:
-            print(f"⚠ Connection lost: {exc}")
\ No newline at end of file
+            _LOGGER.warning("⚠ Connection lost: %s", exc)
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""Tests for the UDP JSON codec (utils/json_codec.py)."""
+import importlib
+import json
+import sys
+import unittest
+from unittest import mock
+
+import open_pico_local_api.utils.json_codec as json_codec
+from open_pico_local_api.enums.device_mode_enum import DeviceModeEnum
+
+
+class _CodecTests:
+    codec = json_codec
+
+    def test_dumps_returns_compact_bytes(self):
+        data = self.codec.json_dumps({"cmd": "stato_sync", "idp": 3})
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(data, b'{"cmd":"stato_sync","idp":3}')
+
+    def test_dumps_int_enum_as_number(self):
+        self.assertEqual(self.codec.json_dumps({"mod": DeviceModeEnum.EXTRACTION}), b'{"mod":2}')
+
+    def test_loads_accepts_bytes(self):
+        self.assertEqual(self.codec.json_loads(b'{"idp": 7, "res": 99}'), {"idp": 7, "res": 99})
+
+    def test_decode_error_is_json_decode_error(self):
+        with self.assertRaises(json.JSONDecodeError):
+            self.codec.json_loads(b"{{broken")
+        with self.assertRaises(self.codec.JSONDecodeError):
+            self.codec.json_loads(b"not json")
+
+
+class TestJsonCodec(_CodecTests, unittest.TestCase):
+    pass
+
+
+class TestJsonCodecStdlibFallback(_CodecTests, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with mock.patch.dict(sys.modules, {"orjson": None}):
+            cls.codec = importlib.reload(json_codec)
+
+    @classmethod
+    def tearDownClass(cls):
+        importlib.reload(json_codec)
+
+    def test_fallback_selected(self):
+        self.assertFalse(self.codec.HAS_ORJSON)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,9 +5,11 @@ from open_pico_local_api.enums.device_mode_enum import DeviceModeEnum
 from open_pico_local_api.enums.on_off_state_enum import OnOffStateEnum
 from open_pico_local_api.enums.target_humidity_enum import TargetHumidityEnum
 from open_pico_local_api.models.command_response_model import CommandResponseModel
-from open_pico_local_api.models.pico_device_model import PicoDeviceModel
+from open_pico_local_api.models import pico_device_model
+from open_pico_local_api.models.pico_device_model import PicoDeviceModel, mode_from_value
 from open_pico_local_api.models.sensor_readings_model import SensorReadingsModel
 from open_pico_local_api.models.operating_parameters_model import OperatingParametersModel
+from open_pico_local_api.models.parameter_arrays_model import ParameterArraysModel
 
 
 # Minimal realistic device payload
@@ -76,6 +78,11 @@ class TestCommandResponseModel(unittest.TestCase):
         self.assertEqual(model.frame_from, "pico")
         self.assertEqual(model.command, "stato_sync")
 
+    def test_is_immutable(self):
+        model = CommandResponseModel.from_dict({"idp": 7})
+        with self.assertRaises(AttributeError):
+            model.idp = 8
+
     def test_from_dict_defaults(self):
         model = CommandResponseModel.from_dict({})
         self.assertEqual(model.idp, 0)
@@ -98,6 +105,7 @@ class TestPicoDeviceModel(unittest.TestCase):
         self.assertEqual(self.model.device_info.ip, "192.168.1.10")
         self.assertEqual(self.model.device_info.firmware_version, "3.2.1")
         self.assertEqual(self.model.device_info.name, "TestPico")
+        self.assertEqual(self.model.device_info.firmware_full, "3.2.1 (stable)")
 
     def test_sensors_temperature(self):
         self.assertAlmostEqual(self.model.sensors.temperature, 22.5)
@@ -148,6 +156,19 @@ class TestPicoDeviceModel(unittest.TestCase):
         self.assertEqual(d["idp"], 42)
         self.assertEqual(d["v_tmpr"], 22.5)
 
+    def test_to_dict_returns_raw_reference(self):
+        self.assertIs(self.model.to_dict(), self.model.raw_data)
+
+    def test_copy_dict_is_independent(self):
+        d = self.model.copy_dict()
+        d["idp"] = 0
+        self.assertEqual(self.model.raw_data["idp"], 42)
+
+    def test_raw_view_is_read_only(self):
+        self.assertEqual(self.model.raw["idp"], 42)
+        with self.assertRaises(TypeError):
+            self.model.raw["idp"] = 0
+
     def test_from_dict_defaults(self):
         # s_umd must be a valid TargetHumidityEnum value (1-3); use minimal valid payload
         minimal = {"s_umd": 1, "mod": 1, "on_off": 2}
@@ -157,6 +178,47 @@ class TestPicoDeviceModel(unittest.TestCase):
         self.assertAlmostEqual(model.sensors.humidity, 0.0)
         self.assertFalse(model.is_on)
 
+    def test_unknown_enum_values_fall_back_to_defaults(self):
+        payload = dict(_FULL_PAYLOAD, mod=99, on_off=7, s_umd=[1])
+        with self.assertLogs("open_pico_local_api.models.pico_device_model", level="WARNING"):
+            model = PicoDeviceModel.from_dict(payload)
+        self.assertIs(model.operating.mode, DeviceModeEnum.HEAT_RECOVERY)
+        self.assertIs(model.operating.on_off, OnOffStateEnum.OFF)
+        self.assertIs(model.sensors.humidity_setpoint, TargetHumidityEnum.FIFTY_PERCENT)
+
+    def test_mode_from_value(self):
+        self.assertIs(mode_from_value(4), DeviceModeEnum.HUMIDITY_RECOVERY)
+        for value in (99, None, "4", [4]):
+            self.assertIsNone(mode_from_value(value))
+
+    def test_from_dict_list_defaults_not_shared(self):
+        a = PicoDeviceModel.from_dict({})
+        b = PicoDeviceModel.from_dict({})
+        self.assertEqual(a.parameters.errors, [])
+        self.assertIsNot(a.parameters.errors, b.parameters.errors)
+        self.assertIsNot(a.device_info.maintenance, b.device_info.maintenance)
+
+    def test_from_dict_tolerates_malformed_errors(self):
+        model = PicoDeviceModel.from_dict(dict(_FULL_PAYLOAD, err=None))
+        self.assertIsNone(model.parameters.errors)
+
+    def test_from_dict_maps_every_table_field(self):
+        tables = (
+            (self.model.device_info, pico_device_model._DEVICE_INFO_FIELDS),
+            (self.model.sensors, pico_device_model._SENSOR_FIELDS),
+            (self.model.parameters, pico_device_model._PARAMETER_FIELDS),
+            (self.model.operating, pico_device_model._OPERATING_FIELDS),
+            (self.model.system, pico_device_model._SYSTEM_FIELDS),
+        )
+        for obj, fields in tables:
+            for attr, key, _ in fields:
+                self.assertEqual(getattr(obj, attr), _FULL_PAYLOAD[key], attr)
+
+    def test_models_use_slots(self):
+        for obj in (self.model, self.model.device_info, self.model.sensors,
+                    self.model.parameters, self.model.operating, self.model.system):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
     def test_unhealthy_when_errors_present(self):
         payload = dict(_FULL_PAYLOAD)
         # errors are List[List[int]] — a non-empty inner list signals an error
@@ -202,6 +264,37 @@ class TestSensorReadingsModel(unittest.TestCase):
         self.assertTrue(m.has_air_quality)
 
 
+class TestParameterArraysModel(unittest.TestCase):
+
+    @staticmethod
+    def _make(errors):
+        return ParameterArraysModel(
+            realtime=[], minmax=[], ambient=[], external=[], errors=errors, manual=[],
+        )
+
+    def test_has_errors_false_for_empty_lists(self):
+        self.assertFalse(self._make([[], []]).has_errors)
+
+    def test_active_errors_flattened(self):
+        m = self._make([[1, 2], [], [3]])
+        self.assertTrue(m.has_errors)
+        self.assertEqual(m.active_errors, [1, 2, 3])
+
+    def test_error_count(self):
+        self.assertEqual(self._make([[1, 2], [], [3]]).error_count, 3)
+        self.assertEqual(self._make([]).error_count, 0)
+
+    def test_active_errors_memoized(self):
+        m = self._make([[4]])
+        self.assertIs(m.active_errors, m.active_errors)
+
+    def test_cache_fields_excluded_from_equality(self):
+        a = self._make([[1]])
+        b = self._make([[1]])
+        _ = a.active_errors
+        self.assertEqual(a, b)
+
+
 class TestOperatingParametersModel(unittest.TestCase):
 
     @staticmethod
@@ -62,6 +62,22 @@ class TestIsValidPicoResponse(unittest.TestCase):
         self.assertFalse(_is_valid_pico_response(r))
 
 
+class TestCollectResponses(unittest.IsolatedAsyncioTestCase):
+
+    async def test_collects_valid_responses_until_deadline(self):
+        q = asyncio.Queue()
+        q.put_nowait(({"idp": 0, "fw_ver": "3.2.1", "mod": 1}, ("10.0.0.7", 40070)))
+        q.put_nowait(({"idp": 5, "fw_ver": "3.2.1", "mod": 1}, ("10.0.0.8", 40070)))
+        discovered = set()
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await PicoAutoDiscovery._collect_responses(q, discovered, duration=0.05, verbose=False)
+
+        self.assertEqual(discovered, {"10.0.0.7"})
+        self.assertLess(loop.time() - started, 0.5)
+
+
 class TestSubnetScanValidation(unittest.IsolatedAsyncioTestCase):
 
     async def test_ipv6_subnet_raises_value_error(self):
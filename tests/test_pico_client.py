@@ -0,0 +1,293 @@
+"""Tests for PicoClient command exchange (no network required)."""
+import asyncio
+import json
+import unittest
+import unittest.mock
+
+from open_pico_local_api.enums.device_mode_enum import DeviceModeEnum
+from open_pico_local_api.exceptions.not_supported_error import NotSupportedError
+import open_pico_local_api.pico_client as pico_client_module
+from open_pico_local_api.pico_client import PicoClient
+from open_pico_local_api.shared_transport_manager import SharedTransportManager, SharedPicoProtocol
+
+
+class _FakeTransport:
+    """Records datagrams instead of sending them."""
+
+    def __init__(self):
+        self.sent = []
+        self.failures = 0  # Number of upcoming sends that raise OSError
+
+    def sendto(self, data, addr=None):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("No buffer space available")
+        self.sent.append((json.loads(bytes(data)), addr))
+
+
+class TestIdpCounter(unittest.TestCase):
+
+    def test_next_idp_wraps_within_range(self):
+        client = PicoClient(ip="10.0.0.9", pin="1234")
+        client._idp_range_start, client._idp_range_size = 11, 3
+        client._idp_counter = 12
+        self.assertEqual([client._get_next_idp() for _ in range(4)], [12, 13, 11, 12])
+
+
+class TestCommandEncoding(unittest.TestCase):
+
+    def test_upd_body_matches_json_encoding(self):
+        client = PicoClient(ip="10.0.0.9", pin="12\"34")
+        data = client._upd_body(b'"on_off":1') + b',"idp":7}'
+        self.assertEqual(json.loads(data), {"on_off": 1, "cmd": "upd_pico", "frm": "app",
+                                            "pin": "12\"34", "idp": 7})
+
+    def test_pin_change_updates_templates(self):
+        client = PicoClient(ip="10.0.0.9", pin="1234")
+        client.pin = "9999"
+        self.assertEqual(json.loads(client._status_body + b',"idp":1}')["pin"], "9999")
+        self.assertEqual(json.loads(client._turn_off_body + b',"idp":1}'),
+                         {"on_off": 2, "cmd": "upd_pico", "frm": "app", "pin": "9999", "idp": 1})
+
+
+class TestPicoClientExchange(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        SharedTransportManager._instance = None
+        SharedTransportManager._lock = asyncio.Lock()
+        self.manager = await SharedTransportManager.get_instance()
+        self.manager._initialized = True
+        self.transport = _FakeTransport()
+        self.protocol = SharedPicoProtocol(self.manager)
+        self.protocol.connection_made(self.transport)
+        self.client = PicoClient(ip="10.0.0.9", pin="1234", timeout=0.5, retry_attempts=1)
+        await self.client.connect()
+
+    async def asyncTearDown(self):
+        await self.client.disconnect()
+        SharedTransportManager._instance = None
+
+    def _deliver(self, payload):
+        self.protocol.datagram_received(
+            json.dumps(payload).encode(), (self.client.ip, self.client.device_port)
+        )
+
+    async def _wait_for_send(self, count=1):
+        for _ in range(200):
+            if len(self.transport.sent) >= count:
+                return self.transport.sent[count - 1][0]
+            await asyncio.sleep(0.005)
+        self.fail("command was not sent")
+
+    async def test_ack_then_status_resolves_command(self):
+        task = asyncio.create_task(self.client.turn_on())
+        cmd = await self._wait_for_send()
+        idp = cmd["idp"]
+
+        self._deliver({"idp": idp, "frm": "mst", "res": 99})
+        self._deliver({"idp": idp, "frm": "mst", "cmd": "upd_pico", "res": 1})
+
+        result = await task
+        self.assertEqual(result.idp, idp)
+        self.assertEqual(self.client._pending, {})
+        self.assertEqual(self.transport.sent[0][1], (self.client.ip, self.client.device_port))
+
+    async def test_hostname_client_accepts_reply_from_other_source_port(self):
+        await self.client.disconnect()
+        self.client = PicoClient(ip="localhost", pin="1234", timeout=0.5, retry_attempts=1)
+        await self.client.connect()
+        task = asyncio.create_task(self.client.turn_on())
+        cmd = await self._wait_for_send()
+        idp = cmd["idp"]
+
+        for payload in ({"idp": idp, "frm": "mst", "res": 99},
+                        {"idp": idp, "frm": "mst", "cmd": "upd_pico", "res": 1}):
+            self.protocol.datagram_received(json.dumps(payload).encode(), ("127.0.0.1", 50123))
+
+        result = await task
+        self.assertEqual(result.idp, idp)
+        self.assertEqual(self.manager.dropped_packets, 0)
+
+    async def test_status_for_other_idp_is_not_consumed(self):
+        task = asyncio.create_task(self.client.turn_on())
+        cmd = await self._wait_for_send()
+        idp = cmd["idp"]
+
+        self._deliver({"idp": idp + 1, "frm": "mst", "cmd": "upd_pico", "res": 1})
+        self.assertFalse(task.done())
+        self._deliver({"idp": idp, "frm": "mst", "cmd": "upd_pico", "res": 1})
+
+        result = await task
+        self.assertEqual(result.idp, idp)
+
+    async def test_client_acks_received_status(self):
+        task = asyncio.create_task(self.client.get_status())
+        cmd = await self._wait_for_send()
+        self._deliver({"idp": cmd["idp"], "frm": "mst", "cmd": "stato_sync", "res": 1, "mod": 1, "s_umd": 1})
+        # The ACK goes out from the receive path, before the caller resumes
+        self.assertEqual(self.transport.sent[1], ({"idp": cmd["idp"], "frm": "app", "res": 99},
+                                                  (self.client.ip, self.client.device_port)))
+        await task
+        self.assertEqual(len(self.transport.sent), 2)
+
+    async def test_change_operating_mode_accepts_enum_and_int(self):
+        for mode in (DeviceModeEnum.HEAT_RECOVERY, int(DeviceModeEnum.HEAT_RECOVERY)):
+            task = asyncio.create_task(self.client.change_operating_mode(mode))
+            cmd = await self._wait_for_send(len(self.transport.sent) + 1)
+            self.assertEqual((cmd["mod"], cmd["on_off"]), (int(mode), 1))
+            self._deliver({"idp": cmd["idp"], "frm": "mst", "cmd": "upd_pico", "res": 1})
+            await task
+            # Cached as the enum member either way, like the status path does
+            self.assertIs(self.client._last_mode, DeviceModeEnum.HEAT_RECOVERY)
+            self.transport.sent.clear()
+
+    async def test_change_fan_speed_rejects_invalid_speed(self):
+        for speed in (37.9, "50", True, -1, 101):
+            with self.assertRaises(ValueError):
+                await self.client.change_fan_speed(speed, force=True)
+        self.assertEqual(self.transport.sent, [])
+
+    async def test_change_operating_mode_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            await self.client.change_operating_mode(999)
+        self.assertEqual(self.transport.sent, [])
+
+    async def test_mode_guard_uses_cached_mode(self):
+        self.client._remember_mode(DeviceModeEnum.HEAT_RECOVERY)
+        task = asyncio.create_task(self.client.set_night_mode(True))
+        cmd = await self._wait_for_send()
+        # No stato_sync round-trip before the command itself
+        self.assertEqual(cmd["night_mod"], 1)
+        self._deliver({"idp": cmd["idp"], "frm": "mst", "cmd": "upd_pico", "res": 1})
+        await task
+
+    async def test_mode_guard_rejects_cached_unsupported_mode(self):
+        self.client._remember_mode(DeviceModeEnum.HUMIDITY_RECOVERY)
+        with self.assertRaises(NotSupportedError):
+            await self.client.set_night_mode(True)
+        self.assertEqual(self.transport.sent, [])
+
+    async def test_command_reply_updates_cached_mode(self):
+        task = asyncio.create_task(self.client.turn_on())
+        cmd = await self._wait_for_send()
+        self._deliver({"idp": cmd["idp"], "frm": "mst", "cmd": "upd_pico", "res": 1,
+                       "mod": int(DeviceModeEnum.HUMIDITY_RECOVERY)})
+        await task
+        self.assertIs(await self.client._current_mode(retry=False), DeviceModeEnum.HUMIDITY_RECOVERY)
+
+    async def test_mode_guard_refreshes_stale_cache(self):
+        self.client.mode_cache_ttl = 0
+        self.client._remember_mode(DeviceModeEnum.HEAT_RECOVERY)
+        task = asyncio.create_task(self.client.set_night_mode(True))
+        cmd = await self._wait_for_send()
+        self.assertEqual(cmd["cmd"], "stato_sync")
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+    async def test_retry_resets_idp_between_attempts(self):
+        self.client.timeout, self.client.retry_attempts, self.client.retry_delay = 0.01, 2, 0
+        start = self.client._idp_range_start
+        self.assertIsNone(await self.client._execute_command_with_retry(self.client._status_body))
+        idps = [sent[0]["idp"] for sent in self.transport.sent]
+        self.assertEqual(idps, list(range(start, start + 5)) * 2)
+        self.assertEqual(self.client._pending, {})
+
+    async def test_sync_idp_on_connect_probes_status(self):
+        await self.client.disconnect()
+        self.client.sync_idp_on_connect = True
+        task = asyncio.create_task(self.client.connect())
+        cmd = await self._wait_for_send()
+        self.assertEqual(cmd["cmd"], "stato_sync")
+        self._deliver({"idp": cmd["idp"], "frm": "mst", "cmd": "stato_sync", "res": 1, "mod": 1, "s_umd": 1})
+        await task
+        self.assertTrue(self.client.connected)
+        self.assertEqual(self.client._idp_counter, cmd["idp"] + 1)
+
+    async def test_sync_idp_on_connect_realigns_to_answered_probe(self):
+        await self.client.disconnect()
+        self.client.sync_idp_on_connect = True
+        with unittest.mock.patch.object(pico_client_module, "_PROBE_IDP_TIMEOUT", 0.01):
+            task = asyncio.create_task(self.client.connect())
+            # The device is two ahead: it ignores the first two probes and answers the third
+            cmd = await self._wait_for_send(3)
+            self._deliver({"idp": cmd["idp"], "frm": "mst", "cmd": "stato_sync", "res": 1, "mod": 1, "s_umd": 1})
+            await task
+        self.assertEqual(cmd["idp"], self.client._idp_range_start + 2)
+        self.assertEqual(self.client._idp_counter, cmd["idp"] + 1)
+
+    async def test_sync_idp_on_connect_send_error_leaves_no_waiter(self):
+        await self.client.disconnect()
+        self.client.sync_idp_on_connect = True
+        self.transport.failures = 1
+        await self.client.connect()
+        self.assertTrue(self.client.connected)
+        self.assertEqual(self.client._pending, {})
+
+    async def test_send_after_transport_shutdown_leaves_no_waiter(self):
+        self.manager._initialized = False
+        with self.assertRaises(RuntimeError):
+            await self.client.turn_on()
+        self.assertEqual(self.client._pending, {})
+
+    async def test_send_error_ends_attempt_and_retries(self):
+        self.client.retry_attempts, self.client.retry_delay = 2, 0
+        self.transport.failures = 1
+        task = asyncio.create_task(self.client.turn_on())
+        cmd = await self._wait_for_send()
+        # The failed send ends attempt 1; attempt 2 starts over from the range start
+        self.assertEqual(cmd["idp"], self.client._idp_range_start)
+        self._deliver({"idp": cmd["idp"], "frm": "mst", "cmd": "upd_pico", "res": 1})
+        self.assertEqual((await task).idp, cmd["idp"])
+
+    async def test_persistent_send_error_is_raised(self):
+        self.client.retry_attempts, self.client.retry_delay = 2, 0
+        self.transport.failures = 10
+        with self.assertRaises(OSError):
+            await self.client.turn_on()
+        self.assertEqual(self.client._pending, {})
+
+    async def test_send_error_propagates_after_one_send_per_attempt(self):
+        self.client.retry_attempts, self.client.retry_delay = 3, 0
+        self.transport.failures = 10
+        with self.assertRaises(OSError):
+            await self.client.turn_on()
+        # No further IDP candidates are tried once a send fails
+        self.assertEqual(self.transport.failures, 10 - 3)
+
+        with self.assertRaises(OSError):
+            await self.client.turn_on(retry=False)
+        self.assertEqual(self.transport.failures, 10 - 4)
+
+    async def test_batched_idp_sync_resyncs_to_answered_idp(self):
+        self.client.idp_sync_batch, self.client.timeout = 3, 0.05
+        task = asyncio.create_task(self.client.turn_on())
+        # The first candidate goes out alone; the device is one ahead and ignores it
+        first = (await self._wait_for_send())["idp"]
+        await self._wait_for_send(4)
+        idps = [sent[0]["idp"] for sent in self.transport.sent]
+        self.assertEqual(idps, [first, first + 1, first + 2, first + 3])
+
+        # Once back in sync the device answers every candidate of the batch
+        for idp in idps[1:]:
+            self._deliver({"idp": idp, "frm": "mst", "cmd": "upd_pico", "res": 1})
+
+        result = await task
+        self.assertEqual(result.idp, idps[1])
+        # The device expects the IDP after the last candidate it answered
+        self.assertEqual(self.client._idp_counter, idps[-1] + 1)
+        self.assertEqual(self.client._pending, {})
+
+    async def test_batched_idp_sync_first_send_is_single(self):
+        self.client.idp_sync_batch = 3
+        task = asyncio.create_task(self.client.turn_on())
+        cmd = await self._wait_for_send()
+        self._deliver({"idp": cmd["idp"], "frm": "mst", "cmd": "upd_pico", "res": 1})
+        await task
+        # An in-sync device gets exactly one copy of the command (plus the client ACK)
+        commands = [sent[0] for sent in self.transport.sent if "cmd" in sent[0]]
+        self.assertEqual([c["idp"] for c in commands], [cmd["idp"]])
+        self.assertEqual(self.client._idp_counter, cmd["idp"] + 1)
+
+if __name__ == "__main__":
+    unittest.main()
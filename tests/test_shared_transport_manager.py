@@ -2,6 +2,7 @@
 import asyncio
 import inspect
 import json
+import socket
 import unittest
 import unittest.mock
 
@@ -64,6 +65,8 @@ class TestSharedTransportManagerUnit(unittest.IsolatedAsyncioTestCase):
         reg = mgr.get_device_registration("dev1")
         self.assertIsNotNone(reg)
         self.assertEqual(reg.ip, "192.168.1.1")
+        self.assertEqual(reg.addr, ("192.168.1.1", 40070))
+        self.assertFalse(hasattr(reg, "__dict__"))
         self.assertIs(reg.response_queue, q)
 
     async def test_find_device_by_idp_after_register(self):
@@ -74,6 +77,7 @@ class TestSharedTransportManagerUnit(unittest.IsolatedAsyncioTestCase):
         start, size = await mgr.register_device("dev2", "192.168.1.2", 40070, q)
 
         self.assertEqual(mgr.find_device_by_idp(start), "dev2")
+        self.assertIs(mgr.find_registration_by_idp(start), mgr.get_device_registration("dev2"))
         self.assertEqual(mgr.find_device_by_idp(start + size - 1), "dev2")
         self.assertIsNone(mgr.find_device_by_idp(start + size))  # Just outside range
 
@@ -98,6 +102,32 @@ class TestSharedTransportManagerUnit(unittest.IsolatedAsyncioTestCase):
 
         self.assertIsNone(mgr.get_device_registration("devY"))
 
+    async def test_unregister_frees_only_its_idp_range(self):
+        mgr = await SharedTransportManager.get_instance()
+        mgr._initialized = True
+
+        start_a, _ = await mgr.register_device("devA", "10.0.0.4", 40070, asyncio.Queue())
+        start_b, _ = await mgr.register_device("devB", "10.0.0.5", 40070, asyncio.Queue())
+        await mgr.unregister_device("devA")
+
+        self.assertIsNone(mgr.find_device_by_idp(start_a))
+        self.assertEqual(mgr.find_device_by_idp(start_b), "devB")
+        self.assertIsNone(mgr.find_device_by_idp(0))
+
+    async def test_unregistered_idp_range_is_reused(self):
+        mgr = await SharedTransportManager.get_instance()
+        mgr._initialized = True
+
+        start_a, _ = await mgr.register_device("devA", "10.0.0.4", 40070, asyncio.Queue())
+        start_b, _ = await mgr.register_device("devB", "10.0.0.5", 40070, asyncio.Queue())
+        await mgr.unregister_device("devA")
+        start_c, _ = await mgr.register_device("devC", "10.0.0.6", 40070, asyncio.Queue())
+
+        self.assertEqual(start_c, start_a)
+        self.assertEqual(mgr.find_device_by_idp(start_c), "devC")
+        start_d, _ = await mgr.register_device("devD", "10.0.0.7", 40070, asyncio.Queue())
+        self.assertEqual(start_d, start_b + mgr._idp_range_size)
+
     async def test_register_device_raises_when_not_initialized(self):
         mgr = await SharedTransportManager.get_instance()
         with self.assertRaises(RuntimeError):
@@ -116,13 +146,13 @@ class TestSharedPicoProtocol(unittest.IsolatedAsyncioTestCase):
             staticmethod
         ))
 
-    async def test_run_callback_sync(self):
+    async def test_call_callback_sync(self):
         called_with = []
 
         def sync_cb(response):
             called_with.append(response)
 
-        await SharedPicoProtocol._run_callback(sync_cb, {"cmd": "test"})
+        SharedPicoProtocol._call_callback(sync_cb, {"cmd": "test"})
         self.assertEqual(called_with, [{"cmd": "test"}])
 
     async def test_run_callback_async(self):
@@ -135,12 +165,47 @@ class TestSharedPicoProtocol(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(called_with, [{"cmd": "async_test"}])
 
     async def test_run_callback_exception_does_not_propagate(self):
-        def bad_cb():
+        def bad_cb(_response):
+            raise ValueError("boom")
+
+        async def bad_async_cb(_response):
             raise ValueError("boom")
 
         # Should not raise; warning is logged via _LOGGER (not print)
-        with unittest.mock.patch("open_pico_local_api.shared_transport_manager._LOGGER"):
-            await SharedPicoProtocol._run_callback(bad_cb, {})
+        with unittest.mock.patch("open_pico_local_api.shared_transport_manager._LOGGER") as logger:
+            SharedPicoProtocol._call_callback(bad_cb, {})
+            await SharedPicoProtocol._run_callback(bad_async_cb, {})
+        self.assertEqual(logger.warning.call_count, 2)
+
+    async def test_event_callbacks_classified_at_registration(self):
+        mgr = await SharedTransportManager.get_instance()
+        mgr._initialized = True
+        called = []
+
+        async def on_status(response):
+            called.append(response)
+
+        start, _ = await mgr.register_device("cb_dev", "10.0.0.7", 40070, asyncio.Queue(),
+                                             event_callbacks={"stato_sync": on_status})
+        self.assertEqual(mgr.get_device_registration("cb_dev").event_callbacks["stato_sync"], (True, on_status))
+
+        protocol = SharedPicoProtocol(mgr, verbose=False)
+        protocol.datagram_received(json.dumps({"idp": start, "cmd": "stato_sync"}).encode(), ("10.0.0.7", 40070))
+        await asyncio.sleep(0)
+        self.assertEqual(called, [{"idp": start, "cmd": "stato_sync"}])
+
+    async def test_sync_event_callback_runs_inline(self):
+        mgr = await SharedTransportManager.get_instance()
+        mgr._initialized = True
+        called = []
+
+        start, _ = await mgr.register_device("sync_cb_dev", "10.0.0.9", 40070, asyncio.Queue(),
+                                             event_callbacks={"stato_sync": called.append})
+        protocol = SharedPicoProtocol(mgr, verbose=False)
+        protocol.datagram_received(json.dumps({"idp": start, "cmd": "stato_sync"}).encode(), ("10.0.0.9", 40070))
+
+        # No event-loop turn needed: the callback ran inside datagram_received
+        self.assertEqual(called, [{"idp": start, "cmd": "stato_sync"}])
 
     async def test_datagram_received_routes_to_device_queue(self):
         mgr = await SharedTransportManager.get_instance()
@@ -159,6 +224,25 @@ class TestSharedPicoProtocol(unittest.IsolatedAsyncioTestCase):
         response, addr = q.get_nowait()
         self.assertEqual(response["idp"], start)
 
+    async def test_datagram_received_resolves_pending_waiter(self):
+        mgr = await SharedTransportManager.get_instance()
+        mgr._initialized = True
+
+        loop = asyncio.get_running_loop()
+        q = asyncio.Queue()
+        pending = {}
+        start, _ = await mgr.register_device("pending_dev", "10.0.0.6", 40070, q, pending=pending)
+        ack_future, response_future = loop.create_future(), loop.create_future()
+        pending[start] = (ack_future, response_future)
+
+        protocol = SharedPicoProtocol(mgr, verbose=False)
+        protocol.datagram_received(json.dumps({"idp": start, "frm": "mst", "res": 99}).encode(), ("10.0.0.6", 40070))
+        protocol.datagram_received(json.dumps({"idp": start, "cmd": "stato_sync", "res": 1}).encode(), ("10.0.0.6", 40070))
+
+        self.assertEqual(ack_future.result()["res"], 99)
+        self.assertEqual(response_future.result()["cmd"], "stato_sync")
+        self.assertTrue(q.empty())
+
     async def test_datagram_received_routes_to_unmatched_queue(self):
         mgr = await SharedTransportManager.get_instance()
         mgr._initialized = True
@@ -172,12 +256,76 @@ class TestSharedPicoProtocol(unittest.IsolatedAsyncioTestCase):
 
         self.assertFalse(unmatched.empty())
 
+    async def test_recycled_range_ignores_previous_owner(self):
+        mgr = await SharedTransportManager.get_instance()
+        mgr._initialized = True
+
+        start, _ = await mgr.register_device("old_dev", "10.0.0.4", 40070, asyncio.Queue())
+        await mgr.unregister_device("old_dev")
+        q, pending, called = asyncio.Queue(), {}, []
+        loop = asyncio.get_running_loop()
+        recycled, _ = await mgr.register_device("new_dev", "10.0.0.6", 40070, q, pending=pending,
+                                                event_callbacks={"stato_sync": called.append})
+        self.assertEqual(recycled, start)
+        waiter = (loop.create_future(), loop.create_future())
+        pending[start] = waiter
+
+        protocol = SharedPicoProtocol(mgr, verbose=False)
+        protocol.datagram_received(json.dumps({"idp": start, "cmd": "stato_sync", "res": 1}).encode(),
+                                   ("10.0.0.4", 40070))
+
+        self.assertFalse(any(future.done() for future in waiter))
+        self.assertTrue(q.empty())
+        self.assertEqual(called, [])
+        self.assertEqual(mgr.dropped_packets, 1)
+
+    async def test_datagram_received_drops_when_response_queue_full(self):
+        mgr = await SharedTransportManager.get_instance()
+        mgr._initialized = True
+
+        q = asyncio.Queue(maxsize=1)
+        start, _ = await mgr.register_device("full_dev", "10.0.0.8", 40070, q)
+        protocol = SharedPicoProtocol(mgr, verbose=False)
+        for _ in range(2):
+            protocol.datagram_received(json.dumps({"idp": start, "cmd": "stato_sync"}).encode(), ("10.0.0.8", 40070))
+
+        self.assertEqual(q.qsize(), 1)
+        self.assertEqual(mgr.dropped_packets, 1)
+
+    async def test_datagram_received_drops_unowned_idp_before_decoding(self):
+        mgr = await SharedTransportManager.get_instance()
+        protocol = SharedPicoProtocol(mgr, verbose=False)
+        with unittest.mock.patch("open_pico_local_api.shared_transport_manager.json_loads") as loads:
+            protocol.datagram_received(b'{"idp": 4242, "cmd": "stato_sync"}', ("10.0.0.99", 40070))
+        loads.assert_not_called()
+        self.assertEqual(mgr.dropped_packets, 1)
+
     async def test_datagram_received_invalid_json_no_raise(self):
         mgr = await SharedTransportManager.get_instance()
         protocol = SharedPicoProtocol(mgr, verbose=False)
         # Should not raise
         protocol.datagram_received(b"not json", ("10.0.0.1", 40070))
 
+    async def test_tune_socket_sets_requested_buffers(self):
+        mgr = await SharedTransportManager.get_instance()
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            default_sndbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+            mgr._transport = unittest.mock.Mock()
+            mgr._transport.get_extra_info.return_value = sock
+            mgr._tune_socket(rcvbuf=1 << 16, sndbuf=None)
+            self.assertGreaterEqual(sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF), 1 << 16)
+            self.assertEqual(sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF), default_sndbuf)
+
+    async def test_tune_socket_ignores_rejected_options(self):
+        mgr = await SharedTransportManager.get_instance()
+        sock = unittest.mock.Mock()
+        sock.setsockopt.side_effect = OSError("not permitted")
+        mgr._transport = unittest.mock.Mock()
+        mgr._transport.get_extra_info.return_value = sock
+        # Must not raise: the OS defaults still work
+        mgr._tune_socket(rcvbuf=1 << 16, sndbuf=1 << 16, busy_poll_us=50)
+        self.assertTrue(sock.setsockopt.called)
+
     async def test_uses_inspect_iscoroutinefunction(self):
         """Verify the module uses inspect.iscoroutinefunction, not asyncio's deprecated version."""
         import open_pico_local_api.shared_transport_manager as stm